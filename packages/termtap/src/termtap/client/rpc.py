@@ -8,6 +8,7 @@ PUBLIC API:
 
 import json
 import socket
+import threading
 import time
 from typing import Any
 
@@ -16,6 +17,9 @@ from ..tmux.ops import build_client_context
 
 __all__ = ["DaemonClient", "DaemonNotRunning", "build_client_context"]
 
+# Seconds the daemon holds a get_status call open waiting for resolution
+_STATUS_WAIT = 25.0
+
 
 class DaemonNotRunning(Exception):
     """Raised when daemon is not running."""
@@ -24,7 +28,11 @@ class DaemonNotRunning(Exception):
 
 
 class DaemonClient:
-    """Thin client for termtap daemon."""
+    """Thin client for termtap daemon.
+
+    Keeps one connection open across calls - the daemon serves any number of
+    requests per connection, so polling loops don't pay a connect per call.
+    """
 
     def __init__(self, auto_start: bool = False):
         """Initialize client.
@@ -33,6 +41,14 @@ class DaemonClient:
             auto_start: Deprecated, always False. Daemon must be started via entry points.
         """
         self._request_id = 0
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the daemon connection. The next call reconnects."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
 
     def call(self, method: str, params: dict[str, Any] | None = None, timeout: float | None = 30.0) -> Any:
         """Make synchronous RPC call.
@@ -49,23 +65,58 @@ class DaemonClient:
             DaemonNotRunning: If daemon is not running
             RPCError: If RPC returns an error
         """
-
-        self._request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": self._request_id,
-        }
-
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
+        with self._lock:
+            self._request_id += 1
+            request = {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or {},
+                "id": self._request_id,
+            }
+
+            try:
+                response_data = self._roundtrip(json.dumps(request, separators=(",", ":")).encode() + b"\n", timeout)
+            except socket.error as e:
+                raise DaemonNotRunning(f"Socket error: {e}")
+
+        response = json.loads(response_data.decode())
+
+        if "error" in response:
+            error = response["error"]
+            raise RPCError(error["code"], error["message"], error.get("data"))
+
+        return response.get("result")
+
+    def _roundtrip(self, payload: bytes, timeout: float | None) -> bytes:
+        """Send one request line and read one response line over the kept-open connection.
+
+        A kept-open connection that the daemon has since closed (restart or stop)
+        fails on send, and only that case is retried once on a fresh connection.
+        Once the request is sent it may have been acted on, so it is never resent -
+        a missing response raises instead. Any failure drops the connection so a
+        late response can't be read as the answer to the next request.
+        """
+        while True:
+            reused = self._sock is not None
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock = self._sock
+            sock.settimeout(timeout)
+
+            try:
+                if not reused:
+                    sock.connect(str(SOCKET_PATH))
+                sock.sendall(payload)
+                break
+            except (BrokenPipeError, ConnectionResetError):
+                self.close()
+                if not reused:
+                    raise
+            except BaseException:
+                self.close()
+                raise
 
         try:
-            sock.connect(str(SOCKET_PATH))
-            sock.sendall(json.dumps(request).encode() + b"\n")
-
-            # Read response
             response_data = b""
             while True:
                 chunk = sock.recv(65536)
@@ -74,19 +125,15 @@ class DaemonClient:
                 response_data += chunk
                 if b"\n" in response_data:
                     break
+        except BaseException:
+            # Includes Ctrl+C mid-wait: the response is still in flight
+            self.close()
+            raise
 
-            response = json.loads(response_data.decode())
-
-            if "error" in response:
-                error = response["error"]
-                raise RPCError(error["code"], error["message"], error.get("data"))
-
-            return response.get("result")
-
-        except socket.error as e:
-            raise DaemonNotRunning(f"Socket error: {e}")
-        finally:
-            sock.close()
+        if not response_data:
+            self.close()
+            raise ConnectionError("Daemon closed the connection")
+        return response_data
 
     def execute(self, pane_id: str, command: str) -> dict:
         """Execute command in pane.
@@ -185,7 +232,8 @@ class DaemonClient:
     def _poll_until_resolved(self, action_id: str) -> dict:
         """Poll action status until resolved.
 
-        Polls forever. Caller handles interruption (Ctrl+C).
+        Each poll long-waits in the daemon, which answers as soon as the action
+        resolves. Polls forever. Caller handles interruption (Ctrl+C).
 
         Args:
             action_id: Action ID to poll
@@ -196,10 +244,11 @@ class DaemonClient:
         # States that mean "still in progress"
         in_progress_states = ("selecting_pane", "ready_check", "watching", "not_found")
         while True:
-            status = self.call("get_status", {"action_id": action_id})
+            status = self.call("get_status", {"action_id": action_id, "wait": _STATUS_WAIT}, timeout=_STATUS_WAIT + 5.0)
             if status.get("status") not in in_progress_states:
                 return status
-            time.sleep(0.5)
+            if status.get("status") == "not_found":
+                time.sleep(0.5)  # Nothing to wait on yet
 
 
 class RPCError(Exception):
@@ -18,10 +18,16 @@ def _cap_output(output: str) -> tuple[str, int]:
 
     Returns total_lines=0 when not truncated.
     """
-    lines = output.splitlines()
-    if len(lines) <= _MAX_OUTPUT_LINES:
+    body = output.removesuffix("\n")
+    total_lines = body.count("\n") + 1 if output else 0
+    if total_lines <= _MAX_OUTPUT_LINES:
         return output, 0
-    return "\n".join(lines[-_MAX_OUTPUT_LINES:]), len(lines)
+
+    # Scan back from the end for the start of the kept tail
+    pos = len(body)
+    for _ in range(_MAX_OUTPUT_LINES):
+        pos = body.rfind("\n", 0, pos)
+    return body[pos + 1 :], total_lines
 
 
 def _truncation_hint(pane_id: str, total_lines: int) -> dict[str, str]:
@@ -10,7 +10,8 @@ from typing import Any
 from ..app import app
 from ..client import DaemonClient
 from ..pane import Pane
-from ..tmux.resolution import validate_pane_id
+from ..tmux.ops import get_pane
+from ..tmux.resolution import is_pane_id
 from ._helpers import build_tips, build_range_info
 
 __all__ = ["pane", "panes"]
@@ -60,9 +61,10 @@ def pane(
     else:
         resolved_pane_id = pane_id
 
-    # Validate pane ID
-    validated_pane_id = validate_pane_id(resolved_pane_id)
-    if not validated_pane_id:
+    # Validate pane ID - check the format before it goes into get_pane's tmux
+    # filter; the exact-ID lookup then also gives the info the capture needs
+    info = get_pane(resolved_pane_id) if is_pane_id(resolved_pane_id) else None
+    if not info:
         return {
             "elements": [
                 {
@@ -76,16 +78,16 @@ def pane(
     # Touch via daemon to register intentional access (best-effort)
     try:
         client = DaemonClient()
-        client.call("touch", {"pane_id": validated_pane_id})
+        client.call("touch", {"pane_id": info.pane_id})
     except Exception:
         pass  # Daemon may not be running
 
     try:
         # Capture using Pane abstraction
         if offset is not None and limit is not None:
-            p = Pane.capture_range(validated_pane_id, offset, limit)
+            p = Pane.capture_range(info.pane_id, offset, limit, info=info)
         else:
-            p = Pane.capture_tail(validated_pane_id, tail)
+            p = Pane.capture_tail(info.pane_id, tail, info=info)
 
         # Build response
         elements = [
@@ -169,18 +171,18 @@ def panes(state) -> dict[str, Any]:
     results = []
 
     for target in targets:
-        validated = validate_pane_id(target)
-        if not validated:
+        info = get_pane(target) if is_pane_id(target) else None
+        if not info:
             continue
 
         # Touch via daemon to register intentional access (best-effort)
         try:
-            client.call("touch", {"pane_id": validated})
+            client.call("touch", {"pane_id": info.pane_id})
         except Exception:
             pass  # Daemon may not be running
 
         try:
-            p = Pane.capture_tail(validated, lines)
+            p = Pane.capture_tail(info.pane_id, lines, info=info)
 
             # Per-pane section
             elements.append({"type": "heading", "content": target, "level": 3})
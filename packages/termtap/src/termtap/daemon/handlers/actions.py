@@ -112,23 +112,20 @@ def register_handlers(rpc, ctx: DaemonContext):
         return {"actions": ctx.queue.to_dict()}
 
     @rpc.method("get_status")
-    async def _get_status(action_id: str):
+    async def _get_status(action_id: str, wait: float = 0):
+        """Get action status, optionally long-polling up to `wait` seconds for resolution."""
         from ..queue import ActionState
 
+        if wait > 0:
+            await ctx.queue.wait_resolved(action_id, wait)
+
         action = ctx.queue.get(action_id)
         if not action:
             return {"status": "not_found"}
-        if action.state == ActionState.COMPLETED:
-            return {"status": "completed", "result": action.result}
-        if action.state == ActionState.CANCELLED:
-            return {"status": "cancelled", "result": action.result}
-        if action.state == ActionState.WATCHING:
-            return {"status": "watching"}
-        if action.state == ActionState.READY_CHECK:
-            return {"status": "ready_check"}
-        if action.state == ActionState.SELECTING_PANE:
-            return {"status": "selecting_pane"}
-        return {"status": "unknown"}
+        # Status strings are the state values themselves - no per-state branch needed
+        if action.state in (ActionState.COMPLETED, ActionState.CANCELLED):
+            return {"status": action.state.value, "result": action.result}
+        return {"status": action.state.value}
 
     @rpc.method("select_pane")
     async def _select_pane(command: str, client_context: dict):
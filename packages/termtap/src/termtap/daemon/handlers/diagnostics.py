@@ -58,7 +58,7 @@ def register_handlers(rpc, ctx: DaemonContext):
                 "servers": len(ctx.daemon._servers),
                 "logs_buffered": len(ctx.daemon._log_buffer),
             },
-            logs=lambda n=50: ctx.daemon._log_buffer[-n:] if ctx.daemon._log_buffer else [],
+            logs=lambda n=50: list(ctx.daemon._log_buffer)[-n:] if ctx.daemon._log_buffer else [],
             raw=SimpleNamespace(
                 queue=ctx.queue,
                 pane_manager=ctx.pane_manager,
@@ -3,6 +3,8 @@
 Handlers for touch, get_pane_data, ls, cleanup.
 """
 
+import asyncio
+
 from ..context import DaemonContext
 
 __all__ = ["register_handlers"]
@@ -35,9 +37,13 @@ def register_handlers(rpc, ctx: DaemonContext):
         # Touch first to register intentional access (e.g., pattern screen viewing)
         ctx.pane_manager.get_or_create(pane_id)
 
-        captured = Pane.capture_tail(pane_id, lines)
-        # Get swp from pane info (Pane doesn't include this)
-        info = get_pane(pane_id)
+        def capture():
+            # Get swp from pane info (Pane doesn't include this)
+            info = get_pane(pane_id)
+            return Pane.capture_tail(pane_id, lines, info), info
+
+        # tmux round-trips run in a worker thread so collectors and other RPCs keep flowing
+        captured, info = await asyncio.to_thread(capture)
 
         return {
             "content": captured.content,
@@ -51,7 +57,7 @@ def register_handlers(rpc, ctx: DaemonContext):
 
         from ...tmux.ops import list_panes
 
-        panes = list_panes()
+        panes = await asyncio.to_thread(list_panes)
         result = []
         for p in panes:
             pane_dict = asdict(p)
@@ -68,12 +68,13 @@ def register_handlers(rpc, ctx: DaemonContext):
     @rpc.method("remove_pattern")
     async def _remove_pattern(process: str, pattern: str, state: str):
         ctx.patterns.remove(process, pattern, state)
-        return {"ok": True}
+        # Include the updated patterns so callers can refresh without another round-trip
+        return {"ok": True, "patterns": ctx.patterns.all()}
 
     @rpc.method("remove_pair")
     async def _remove_pair(process: str, ready: str, busy: str):
         ctx.patterns.remove_pair(process, ready, busy)
-        return {"ok": True}
+        return {"ok": True, "patterns": ctx.patterns.all()}
 
     @rpc.method("get_hooks")
     async def _get_hooks(process: str | None = None):
@@ -21,15 +21,14 @@ __all__ = ["start_daemon", "stop_daemon", "daemon_status", "is_daemon_running"]
 
 def is_daemon_running() -> bool:
     """Check if daemon is running by checking PID file and socket."""
-    if not PID_PATH.exists():
-        return False
-
     try:
         pid = int(PID_PATH.read_text().strip())
         # Check if process exists
         os.kill(pid, 0)
         # Also verify socket exists
         return SOCKET_PATH.exists()
+    except FileNotFoundError:
+        return False
     except (ValueError, ProcessLookupError, PermissionError):
         # Stale PID file
         _cleanup_stale()
@@ -39,11 +38,10 @@ def is_daemon_running() -> bool:
 def _cleanup_stale():
     """Clean up stale PID and socket files."""
     for path in [PID_PATH, SOCKET_PATH]:
-        if path.exists():
-            try:
-                path.unlink()
-            except OSError:
-                pass
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 def start_daemon(foreground: bool = False) -> dict:
@@ -70,7 +68,7 @@ def start_daemon(foreground: bool = False) -> dict:
 def _run_daemon_foreground() -> dict:
     """Run daemon in foreground (blocking)."""
     pid = os.getpid()
-    PID_PATH.write_text(str(pid))
+    _write_pid(pid)
     atexit.register(_cleanup_on_exit)
 
     from .server import TermtapDaemon
@@ -112,7 +110,7 @@ def _run_daemon_background() -> dict:
     sys.stderr = open(os.devnull, "w")
 
     # Write PID
-    PID_PATH.write_text(str(os.getpid()))
+    _write_pid(os.getpid())
     atexit.register(_cleanup_on_exit)
 
     from .server import TermtapDaemon
@@ -129,11 +127,24 @@ def _run_daemon_background() -> dict:
     os._exit(0)
 
 
+def _write_pid(pid: int):
+    """Write PID file atomically so readers never see a partial file.
+
+    A torn read would fail int() and make is_daemon_running() delete the
+    PID and socket of a live daemon as stale.
+
+    Args:
+        pid: Daemon process ID
+    """
+    tmp_path = PID_PATH.with_name(f"{PID_PATH.name}.{pid}.tmp")
+    tmp_path.write_text(str(pid))
+    os.replace(tmp_path, PID_PATH)
+
+
 def _cleanup_on_exit():
     """Clean up PID file on exit."""
     try:
-        if PID_PATH.exists():
-            PID_PATH.unlink()
+        PID_PATH.unlink(missing_ok=True)
     except OSError:
         pass
 
@@ -163,8 +174,8 @@ def stop_daemon(timeout: float = 5.0) -> dict:
         return {"status": "not_running"}
 
     # Wait for graceful shutdown
-    start = time.time()
-    while time.time() - start < timeout:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
             os.kill(pid, 0)
             time.sleep(0.1)
@@ -192,11 +203,10 @@ def daemon_status() -> dict:
     running = is_daemon_running()
     pid = None
 
-    if PID_PATH.exists():
-        try:
-            pid = int(PID_PATH.read_text().strip())
-        except ValueError:
-            pass
+    try:
+        pid = int(PID_PATH.read_text().strip())
+    except (ValueError, FileNotFoundError):
+        pass
 
     return {
         "running": running,
@@ -6,6 +6,7 @@ PUBLIC API:
   - ActionState: Unified state enum for action lifecycle
 """
 
+import asyncio
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -43,7 +44,7 @@ class Action:
     pane_id: str  # %id or "" for pane selection
     command: str
     state: ActionState
-    timestamp: float = field(default_factory=lambda: time.time())
+    timestamp: float = field(default_factory=time.time)
     result: dict | None = None
     multi_select: bool = False
     pair_mode: bool = False
@@ -74,15 +75,19 @@ class ActionQueue:
     in action.result when user responds.
     """
 
-    def __init__(self, max_size: int = 100):
+    def __init__(self, max_size: int = 100, max_resolved: int = 1000):
         """Initialize queue.
 
         Args:
             max_size: Maximum number of pending actions
+            max_resolved: Maximum number of resolved actions kept for status lookup
         """
         self.max_size = max_size
+        self.max_resolved = max_resolved
         self.pending: list[Action] = []
-        self.resolved: dict[str, Action] = {}  # Track resolved for status lookup
+        self.resolved: dict[str, Action] = {}  # Track resolved for status lookup (oldest first)
+        self._waiters: dict[str, asyncio.Event] = {}  # Set when the action leaves pending
+        self._waiter_counts: dict[str, int] = {}  # Callers currently waiting, per action
 
     def add(
         self,
@@ -115,7 +120,6 @@ class ActionQueue:
             pane_id=pane_id,
             command=command,
             state=state,
-            timestamp=time.time(),
             multi_select=multi_select,
             client_context=client_context or {},
         )
@@ -135,7 +139,7 @@ class ActionQueue:
                 action.result = result
                 action.state = ActionState.COMPLETED
                 self.pending.pop(i)
-                self.resolved[action_id] = action  # Keep for status lookup
+                self._keep_resolved(action)
                 return
 
     def cancel(self, action_id: str, reason: str = "cancelled"):
@@ -150,9 +154,49 @@ class ActionQueue:
                 action.result = {"error": reason}
                 action.state = ActionState.CANCELLED
                 self.pending.pop(i)
-                self.resolved[action_id] = action  # Keep for status lookup
+                self._keep_resolved(action)
                 return
 
+    def _keep_resolved(self, action: Action):
+        """Keep resolved action for status lookup, evicting the oldest past max_resolved.
+
+        Args:
+            action: Action that just left the pending list
+        """
+        self.resolved[action.id] = action
+        if len(self.resolved) > self.max_resolved:
+            del self.resolved[next(iter(self.resolved))]
+
+        waiter = self._waiters.pop(action.id, None)
+        if waiter:
+            waiter.set()
+
+    async def wait_resolved(self, action_id: str, timeout: float):
+        """Wait until a pending action is resolved or cancelled.
+
+        Returns immediately if the action is not pending.
+
+        Args:
+            action_id: ID of action to wait for
+            timeout: Maximum seconds to wait
+        """
+        if not any(action.id == action_id for action in self.pending):
+            return
+        waiter = self._waiters.setdefault(action_id, asyncio.Event())
+        self._waiter_counts[action_id] = self._waiter_counts.get(action_id, 0) + 1
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except TimeoutError:
+            pass
+        finally:
+            # Drop the event with the last waiter, so timed-out polls on actions
+            # that never resolve don't leave entries behind
+            remaining = self._waiter_counts.pop(action_id) - 1
+            if remaining:
+                self._waiter_counts[action_id] = remaining
+            elif self._waiters.get(action_id) is waiter:
+                del self._waiters[action_id]
+
     def get(self, action_id: str) -> Action | None:
         """Get action by ID.
 
@@ -101,11 +101,11 @@ class RPCDispatcher:
 
     def _success_response(self, request_id: Any, result: Any) -> bytes:
         response = {"jsonrpc": "2.0", "result": result, "id": request_id}
-        return json.dumps(response).encode() + b"\n"
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
 
     def _error_response(self, request_id: Any, code: int, message: str, data: Any = None) -> bytes:
         error = {"code": code, "message": message}
         if data is not None:
             error["data"] = data
         response = {"jsonrpc": "2.0", "error": error, "id": request_id}
-        return json.dumps(response).encode() + b"\n"
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
@@ -9,6 +9,7 @@ import json
 import logging
 import signal
 from asyncio import StreamReader, StreamWriter
+from collections import deque
 
 from ..handler.patterns import PatternStore
 from ..paths import SOCKET_PATH, EVENTS_SOCKET_PATH, COLLECTOR_SOCK_PATH
@@ -42,7 +43,10 @@ class TermtapDaemon:
         self.master_companion: StreamWriter | None = None
         self._running = False
         self._servers: list[asyncio.Server] = []
-        self._log_buffer: list[str] = []  # Ring buffer for recent logs
+        # Open RPC and collector connections - closed on stop, since
+        # Server.wait_closed() waits for every connection to go away
+        self._connections: set[StreamWriter] = set()
+        self._log_buffer: deque[str] = deque(maxlen=500)  # Ring buffer for recent logs
 
         self.pane_manager: PaneManager | None = None
         self.queue: ActionQueue | None = None
@@ -68,15 +72,13 @@ class TermtapDaemon:
         """Add handler to capture logs in memory."""
 
         class BufferHandler(logging.Handler):
-            def __init__(self, buffer: list[str]):
+            def __init__(self, buffer: deque[str]):
                 super().__init__()
                 self.buffer = buffer
 
             def emit(self, record):
                 msg = f"[{record.levelname}] {record.name}: {record.getMessage()}"
-                self.buffer.append(msg)
-                if len(self.buffer) > 500:  # Keep last 500
-                    self.buffer.pop(0)
+                self.buffer.append(msg)  # deque maxlen drops the oldest
 
         handler = BufferHandler(self._log_buffer)
         handler.setLevel(logging.DEBUG)
@@ -185,10 +187,11 @@ class TermtapDaemon:
         if window in self.companion_windows:
             return
 
-        import subprocess
         import sys
 
-        cmd = ["tmux", "display-popup", "-E", "-w", "80%", "-h", "60%"]
+        from ..tmux.core import popen_tmux
+
+        cmd = ["display-popup", "-E", "-w", "80%", "-h", "60%"]
 
         # Target the client directly with -c flag
         if client_context.get("client"):
@@ -196,7 +199,7 @@ class TermtapDaemon:
 
         cmd.extend([sys.executable, "-m", "termtap", "companion", "--popup"])
 
-        subprocess.Popen(cmd)
+        popen_tmux(cmd)
         # Don't block - companion will load queue when it connects
 
     async def _delayed_popup(self, action_id: str, client_context: dict, delay: float):
@@ -217,8 +220,7 @@ class TermtapDaemon:
 
         # Clean up old sockets
         for sock_path in [SOCKET_PATH, EVENTS_SOCKET_PATH, COLLECTOR_SOCK_PATH]:
-            if sock_path.exists():
-                sock_path.unlink()
+            sock_path.unlink(missing_ok=True)
 
         # Start RPC server
         rpc_server = await asyncio.start_unix_server(self._handle_rpc, path=str(SOCKET_PATH))
@@ -258,15 +260,16 @@ class TermtapDaemon:
             writer.close()
             await writer.wait_closed()
 
-        # Close servers
+        # Close kept-open RPC and collector connections, then the servers
+        for writer in list(self._connections):
+            writer.close()
         for server in self._servers:
             server.close()
             await server.wait_closed()
 
         # Clean up sockets
         for sock_path in [SOCKET_PATH, EVENTS_SOCKET_PATH, COLLECTOR_SOCK_PATH]:
-            if sock_path.exists():
-                sock_path.unlink()
+            sock_path.unlink(missing_ok=True)
 
         logger.info("Daemon stopped")
 
@@ -285,6 +288,7 @@ class TermtapDaemon:
         """
         pane_id: str | None = None
         bytes_received = 0
+        self._connections.add(writer)
         try:
             # First line is pane_id
             line = await reader.readline()
@@ -310,6 +314,7 @@ class TermtapDaemon:
         except Exception as e:
             logger.error(f"Collector {pane_id} unexpected error: {e}", exc_info=True)
         finally:
+            self._connections.discard(writer)
             # Mark pipe as inactive so it can be restarted
             if pane_id and self.pane_manager:
                 logger.warning(f"Pipe-pane collector stopped for {pane_id} (total: {bytes_received} bytes)")
@@ -326,6 +331,7 @@ class TermtapDaemon:
 
     async def _handle_rpc(self, reader: StreamReader, writer: StreamWriter):
         """Handle incoming RPC connection."""
+        self._connections.add(writer)
         try:
             while True:
                 data = await reader.readline()
@@ -335,9 +341,10 @@ class TermtapDaemon:
                 response = await self.rpc.dispatch(data)
                 writer.write(response)
                 await writer.drain()
-        except ConnectionResetError:
+        except (ConnectionResetError, BrokenPipeError):
             pass
         finally:
+            self._connections.discard(writer)
             writer.close()
             await writer.wait_closed()
 
@@ -402,19 +409,15 @@ class TermtapDaemon:
             action_id = action_data.get("id")
             state_str = action_data.get("state", "")
 
-            # Get delay based on action state
-            try:
-                state = ActionState(state_str)
-                delay = POPUP_DELAYS.get(state, 0.0)
-            except ValueError:
-                delay = 0.0
+            # Get delay based on action state (str-valued enum keys match the raw string)
+            delay = POPUP_DELAYS.get(state_str, 0.0)
 
             asyncio.create_task(self._delayed_popup(action_id, client_context, delay))
 
         if not self.event_clients:
             return
 
-        data = json.dumps(event).encode() + b"\n"
+        data = json.dumps(event, separators=(",", ":")).encode() + b"\n"
         dead_clients = []
 
         for writer in self.event_clients:
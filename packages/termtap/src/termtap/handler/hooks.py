@@ -14,7 +14,7 @@ from .patterns import compile_dsl
 __all__ = ["Hook", "HookManager"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Hook:
     """A single hook configuration."""
 
@@ -38,10 +38,10 @@ class Hook:
     def can_fire(self) -> bool:
         if self.debounce <= 0:
             return True
-        return (time.time() - self._last_fired) >= self.debounce
+        return (time.monotonic() - self._last_fired) >= self.debounce
 
     def mark_fired(self) -> None:
-        self._last_fired = time.time()
+        self._last_fired = time.monotonic()
 
 
 @dataclass
@@ -7,9 +7,10 @@ PUBLIC API:
   - DSLError: DSL parsing and compilation errors
 """
 
+import os
 import re
-import tempfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,10 @@ if TYPE_CHECKING:
 
 __all__ = ["PatternStore", "Pattern", "PatternPair", "compile_dsl", "DSLError"]
 
+# libyaml C loader/dumper when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class DSLError(Exception):
     """DSL parsing and compilation errors."""
@@ -65,8 +70,9 @@ def parse_quantifier(dsl: str, pos: int) -> tuple[str, int]:
     return ("+", 0)  # Default
 
 
+@lru_cache(maxsize=512)
 def compile_dsl(dsl: str) -> re.Pattern:
-    """Compile DSL string to regex pattern.
+    """Compile DSL string to regex pattern (memoized - matching recompiles per line).
 
     DSL Syntax:
         Types:      #=digit, w=word, .=any, _=space
@@ -148,7 +154,35 @@ def compile_dsl(dsl: str) -> re.Pattern:
     return re.compile("".join(result))
 
 
-@dataclass
+def _normalize_output(output: str) -> list[str]:
+    """Split output into lines with trailing whitespace stripped.
+
+    Normalizes between tmux capture-pane (strips trailing spaces)
+    and pipe-pane stream (preserves trailing spaces).
+
+    Args:
+        output: Output text
+
+    Returns:
+        Normalized output lines
+    """
+    return [line.rstrip() for line in output.rstrip("\n").split("\n")]
+
+
+@lru_cache(maxsize=512)
+def _compile_lines(raw: str) -> tuple[re.Pattern, ...]:
+    """Compile each line of a DSL pattern (memoized - Pattern objects are rebuilt per match).
+
+    Args:
+        raw: DSL pattern string (may have newlines)
+
+    Returns:
+        One compiled regex per pattern line
+    """
+    return tuple(compile_dsl(line) for line in raw.strip().split("\n"))
+
+
+@dataclass(slots=True)
 class Pattern:
     """Single or multi-line pattern with DSL support."""
 
@@ -186,25 +220,33 @@ class Pattern:
         Returns:
             True if pattern matches
         """
-        # Strip trailing whitespace from each line to normalize between:
-        # - tmux capture-pane (strips trailing spaces)
-        # - pipe-pane stream (preserves trailing spaces)
-        output_lines = [line.rstrip() for line in output.rstrip("\n").split("\n")]
-        pattern_lines = self.lines
+        return self.matches_lines(_normalize_output(output))
+
+    def matches_lines(self, output_lines: list[str]) -> bool:
+        """Check if pattern matches output already split by _normalize_output.
+
+        Lets callers testing many patterns against one output normalize it once.
+
+        Args:
+            output_lines: Normalized output lines
 
-        if len(output_lines) < len(pattern_lines):
+        Returns:
+            True if pattern matches
+        """
+        line_regexes = _compile_lines(self.raw)
+
+        if len(output_lines) < len(line_regexes):
             return False
 
         # Single-line pattern: search anywhere
-        if len(pattern_lines) == 1:
-            line_regex = compile_dsl(pattern_lines[0])
+        if len(line_regexes) == 1:
+            line_regex = line_regexes[0]
             return any(line_regex.search(line) for line in output_lines)
 
         # Multi-line pattern: find consecutive sequence anywhere
-        for start_idx in range(len(output_lines) - len(pattern_lines) + 1):
+        for start_idx in range(len(output_lines) - len(line_regexes) + 1):
             match = True
-            for i, pattern_line in enumerate(pattern_lines):
-                line_regex = compile_dsl(pattern_line)
+            for i, line_regex in enumerate(line_regexes):
                 if not line_regex.search(output_lines[start_idx + i]):
                     match = False
                     break
@@ -213,7 +255,7 @@ class Pattern:
         return False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PatternPair:
     """Linked ready+busy pattern pair."""
 
@@ -248,14 +290,11 @@ class PatternStore:
             self._hook_manager.load_from_patterns(self.patterns)
 
     def load(self):
-        """Load patterns from YAML file."""
-        if self.path.exists():
-            try:
-                with open(self.path) as f:
-                    self.patterns = yaml.safe_load(f) or {}
-            except (yaml.YAMLError, IOError):
-                self.patterns = {}
-        else:
+        """Load patterns from YAML file (missing file means no patterns)."""
+        try:
+            with open(self.path) as f:
+                self.patterns = yaml.load(f, Loader=_YAML_LOADER) or {}
+        except (yaml.YAMLError, IOError):
             self.patterns = {}
         self.reload_hooks()
 
@@ -263,12 +302,16 @@ class PatternStore:
         """Save patterns to YAML file (atomic write)."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temp file first, then rename (atomic)
-        with tempfile.NamedTemporaryFile(mode="w", dir=self.path.parent, delete=False, suffix=".yaml") as f:
-            yaml.safe_dump(self.patterns, f, default_flow_style=False)
-            temp_path = Path(f.name)
+        # Write to a sibling temp file, then swap it in (atomic) - never leave a stray temp behind
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w") as f:
+                yaml.dump(self.patterns, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-        temp_path.rename(self.path)
         self.reload_hooks()
 
     def match(self, process: str, output: str) -> str | None:
@@ -294,16 +337,18 @@ class PatternStore:
         Returns:
             Tuple of (state, matched_pattern) or (None, None) if no match
         """
+        # Normalize once - every candidate pattern is tested against the same lines
+        output_lines = _normalize_output(output)
         if process in ("ssh", "", None):
-            return self._match_all_with_info(output)
-        return self._match_process_with_info(process, output)
+            return self._match_all_with_info(output_lines)
+        return self._match_process_with_info(process, output_lines)
 
-    def _match_process_with_info(self, process: str, output: str) -> tuple[str | None, str | None]:
+    def _match_process_with_info(self, process: str, output_lines: list[str]) -> tuple[str | None, str | None]:
         """Check patterns for specific process with matched pattern info.
 
         Args:
             process: Process name
-            output: Output text
+            output_lines: Normalized output lines
 
         Returns:
             Tuple of (state, matched_pattern) or (None, None)
@@ -320,7 +365,7 @@ class PatternStore:
                     ready_pattern = pair_dict.get("ready")
                     if ready_pattern and isinstance(ready_pattern, str):
                         pattern = Pattern(raw=ready_pattern, process=process, state="ready")
-                        if pattern.matches(output):
+                        if pattern.matches_lines(output_lines):
                             return ("ready", ready_pattern)
 
         # Check standalone patterns
@@ -331,22 +376,22 @@ class PatternStore:
                 continue
             for raw in pattern_list:
                 pattern = Pattern(raw=raw, process=process, state=state)
-                if pattern.matches(output):
+                if pattern.matches_lines(output_lines):
                     return (state, raw)
 
         return (None, None)
 
-    def _match_all_with_info(self, output: str) -> tuple[str | None, str | None]:
+    def _match_all_with_info(self, output_lines: list[str]) -> tuple[str | None, str | None]:
         """Check all patterns with info (for ssh/unknown).
 
         Args:
-            output: Output text
+            output_lines: Normalized output lines
 
         Returns:
             Tuple of (state, matched_pattern) or (None, None)
         """
         for process in self.patterns:
-            state, pattern = self._match_process_with_info(process, output)
+            state, pattern = self._match_process_with_info(process, output_lines)
             if state:
                 return (state, pattern)
         return (None, None)
@@ -359,7 +404,10 @@ class PatternStore:
             pattern: DSL pattern string
             state: State this pattern indicates
         """
-        self.patterns.setdefault(process, {}).setdefault(state, []).append(pattern)
+        state_patterns = self.patterns.setdefault(process, {}).setdefault(state, [])
+        if pattern in state_patterns:
+            return  # Already learned, nothing to write
+        state_patterns.append(pattern)
         self.save()
 
     def add_pair(self, process: str, ready: str, busy: str):
@@ -377,7 +425,10 @@ class PatternStore:
         pairs_list = proc_patterns["pairs"]
         # Type narrowing for list operations
         if isinstance(pairs_list, list):
-            pairs_list.append({"ready": ready, "busy": busy})  # type: ignore
+            pair = {"ready": ready, "busy": busy}
+            if pair in pairs_list:
+                return  # Already learned, nothing to write
+            pairs_list.append(pair)  # type: ignore
         self.save()
 
     def get_pair_for_ready(self, process: str, ready_pattern: str) -> PatternPair | None:
@@ -415,7 +466,7 @@ class PatternStore:
         """
         if process not in self.patterns:
             return
-        if state not in self.patterns[process]:
+        if pattern not in self.patterns[process].get(state, []):
             return
 
         self.patterns[process][state] = [p for p in self.patterns[process][state] if p != pattern]
@@ -450,6 +501,8 @@ class PatternStore:
                 if item.get("ready") == ready and item.get("busy") == busy:
                     continue  # Skip this pair
                 new_pairs.append(item)
+        if len(new_pairs) == len(pairs_raw):
+            return  # No such pair, nothing to write
 
         if new_pairs:
             self.patterns[process]["pairs"] = new_pairs  # type: ignore
@@ -504,5 +557,7 @@ class PatternStore:
             process: Process name
             config: Full config dict for the process
         """
+        if self.patterns.get(process) == config:
+            return  # Unchanged, nothing to write
         self.patterns[process] = config
         self.save()
@@ -6,12 +6,12 @@ PUBLIC API:
 
 from dataclasses import dataclass
 
-from .tmux.ops import get_pane, capture_pane
+from .tmux.ops import PaneInfo, get_pane, capture_pane
 
 __all__ = ["Pane"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pane:
     """Unified pane data with content + process.
 
@@ -31,25 +31,24 @@ class Pane:
     # --- Capture constructors ---
 
     @classmethod
-    def capture_tail(cls, pane_id: str, n: int) -> "Pane":
+    def capture_tail(cls, pane_id: str, n: int, info: PaneInfo | None = None) -> "Pane":
         """Capture last N lines (Python-side filtering).
 
         Args:
             pane_id: Pane ID (%id format)
             n: Number of lines to capture
+            info: Pane info already resolved by the caller (looked up if omitted)
 
         Returns:
             Pane with last N lines
         """
-        info = get_pane(pane_id)
+        info = info or get_pane(pane_id)
         all_content = capture_pane(pane_id)
-        all_lines = all_content.splitlines() if all_content else []
-        total = len(all_lines)
+        total = all_content.count("\n")
 
-        # Get last N lines (Python filtering)
-        tail_lines = all_lines[-n:] if len(all_lines) > n else all_lines
-        content = "\n".join(tail_lines) + ("\n" if tail_lines else "")
-        start = max(0, total - len(tail_lines))
+        # Get last N lines (Python filtering) - scan back from the end instead of splitting everything
+        content = all_content[cls._tail_offset(all_content, n) :] if n > 0 else all_content
+        start = total - content.count("\n")
 
         return cls(
             pane_id=pane_id,
@@ -60,18 +59,19 @@ class Pane:
         )
 
     @classmethod
-    def capture_range(cls, pane_id: str, offset: int, limit: int) -> "Pane":
+    def capture_range(cls, pane_id: str, offset: int, limit: int, info: PaneInfo | None = None) -> "Pane":
         """Capture specific range for paging (Python-side filtering).
 
         Args:
             pane_id: Pane ID (%id format)
             offset: Starting line number (0-indexed)
             limit: Number of lines to capture
+            info: Pane info already resolved by the caller (looked up if omitted)
 
         Returns:
             Pane with specified range
         """
-        info = get_pane(pane_id)
+        info = info or get_pane(pane_id)
         all_content = capture_pane(pane_id)
         all_lines = all_content.splitlines() if all_content else []
         total = len(all_lines)
@@ -91,17 +91,18 @@ class Pane:
     # --- Stream constructors ---
 
     @classmethod
-    def from_stream(cls, terminal, n: int = 10) -> "Pane":
+    def from_stream(cls, terminal, n: int = 10, info: PaneInfo | None = None) -> "Pane":
         """From stream buffer, last N lines.
 
         Args:
             terminal: PaneTerminal instance
             n: Number of lines to get
+            info: Pane info already resolved by the caller (looked up if omitted)
 
         Returns:
             Pane with last N lines from stream
         """
-        info = get_pane(terminal.pane_id)
+        info = info or get_pane(terminal.pane_id)
         content = terminal.screen.last_n_lines(n)
         total = terminal.screen.line_count
         return cls(
@@ -113,16 +114,17 @@ class Pane:
         )
 
     @classmethod
-    def from_stream_all(cls, terminal) -> "Pane":
+    def from_stream_all(cls, terminal, info: PaneInfo | None = None) -> "Pane":
         """All content from stream buffer (for execute output).
 
         Args:
             terminal: PaneTerminal instance
+            info: Pane info already resolved by the caller (looked up if omitted)
 
         Returns:
             Pane with all buffer content
         """
-        info = get_pane(terminal.pane_id)
+        info = info or get_pane(terminal.pane_id)
         content = terminal.screen.all_content()
         total = terminal.screen.line_count
 
@@ -140,7 +142,7 @@ class Pane:
     _DEFAULT_CAPTURE_LIMIT = 100
 
     @classmethod
-    def get(cls, pane_id: str, terminal=None, n: int | None = None) -> "Pane":
+    def get(cls, pane_id: str, terminal=None, n: int | None = None, info: PaneInfo | None = None) -> "Pane":
         """Unified retrieval - stream if available, capture if not.
 
         Encapsulates the stream-or-capture decision in one place.
@@ -150,14 +152,33 @@ class Pane:
             pane_id: Pane ID (%id format)
             terminal: PaneTerminal if available (for stream access)
             n: Number of lines (None = all stream content, or default limit for capture)
+            info: Pane info already resolved by the caller (looked up if omitted)
 
         Returns:
             Pane with content + process in sync
         """
         if terminal and terminal.bytes_fed > 0:
-            return cls.from_stream_all(terminal) if n is None else cls.from_stream(terminal, n)
+            return cls.from_stream_all(terminal, info) if n is None else cls.from_stream(terminal, n, info)
         else:
             limit = n if n is not None else cls._DEFAULT_CAPTURE_LIMIT
-            return cls.capture_tail(pane_id, limit)
+            return cls.capture_tail(pane_id, limit, info)
 
     # --- Helpers ---
+
+    @staticmethod
+    def _tail_offset(content: str, n: int) -> int:
+        """Find where the last N lines of capture_pane output begin.
+
+        Args:
+            content: Newline-terminated lines, as returned by capture_pane
+            n: Number of lines wanted
+
+        Returns:
+            Offset of the first of the last N lines (0 if there are fewer)
+        """
+        pos = len(content) - 1  # Skip the final terminator
+        for _ in range(n):
+            pos = content.rfind("\n", 0, pos)
+            if pos < 0:
+                return 0
+        return pos + 1
@@ -59,13 +59,16 @@ def get_state_dir() -> Path:
     return path
 
 
+# Resolve and create the runtime dir once, not once per path
+_runtime_dir = get_runtime_dir()
+
 # Socket paths
-SOCKET_PATH = get_runtime_dir() / "daemon.sock"
-EVENTS_SOCKET_PATH = get_runtime_dir() / "events.sock"
-COLLECTOR_SOCK_PATH = get_runtime_dir() / "collector.sock"
+SOCKET_PATH = _runtime_dir / "daemon.sock"
+EVENTS_SOCKET_PATH = _runtime_dir / "events.sock"
+COLLECTOR_SOCK_PATH = _runtime_dir / "collector.sock"
 
 # PID file
-PID_PATH = get_runtime_dir() / "daemon.pid"
+PID_PATH = _runtime_dir / "daemon.pid"
 
 # Config file
 PATTERNS_PATH = get_config_dir() / "patterns.yaml"
@@ -13,6 +13,9 @@ class LineBuffer:
     or extended when cursor is beyond current length.
     """
 
+    # One per screen line, up to max_lines per pane - skip the per-instance __dict__
+    __slots__ = ("_chars", "cursor")
+
     def __init__(self) -> None:
         self._chars: list[str] = []
         self.cursor: int = 0
@@ -25,12 +28,12 @@ class LineBuffer:
         - If cursor >= len, append new char (normal writing)
         - Cursor advances after each char
         """
-        for char in text:
-            if self.cursor < len(self._chars):
-                self._chars[self.cursor] = char
-            else:
-                self._chars.append(char)
-            self.cursor += 1
+        # Same effect as a per-char loop, done as one list operation
+        if self.cursor < len(self._chars):
+            self._chars[self.cursor : self.cursor + len(text)] = text
+        else:
+            self._chars.extend(text)
+        self.cursor += len(text)
 
     def set_cursor(self, col: int) -> None:
         """Set cursor position (0-indexed).
@@ -5,12 +5,17 @@ PUBLIC API:
 """
 
 import logging
+import shlex
+import sys
+import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from ..daemon.queue import Action, ActionState
-from ..handler.patterns import PatternStore
+from ..handler.patterns import PatternStore, compile_dsl
 from ..pane import Pane
+from ..tmux.core import run_tmux
+from ..tmux.ops import get_pane, list_pane_ids
 from .pane_terminal import PaneTerminal
 
 if TYPE_CHECKING:
@@ -18,6 +23,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# pipe-pane command prefix - the interpreter path never changes for this process.
+# Shell-quoted, then "#" doubled because tmux expands formats in the command.
+_COLLECTOR_CMD = shlex.join([sys.executable, "-m", "termtap.daemon.collector"]).replace("#", "##")
+
 
 class PaneManager:
     """Manages all PaneTerminals and routes stream data.
@@ -61,8 +70,6 @@ class PaneManager:
         Returns:
             PaneTerminal for this pane
         """
-        import time
-
         if pane_id not in self.panes:
             self.panes[pane_id] = PaneTerminal.create(pane_id, max_lines=self.max_lines)
         pane = self.panes[pane_id]
@@ -81,7 +88,11 @@ class PaneManager:
         - READY_CHECK + "ready" match → signal auto-transition (daemon sends command)
         - WATCHING + "ready" match → capture output, complete action
         """
-        pane = self.get_or_create(pane_id)
+        # Plain lookup - incoming output is not an intentional access, so
+        # last_accessed (the working-set recency) is left alone
+        pane = self.panes.get(pane_id)
+        if pane is None:
+            pane = self.panes[pane_id] = PaneTerminal.create(pane_id, max_lines=self.max_lines)
         logger.debug(f"Pane {pane_id} received {len(data)} bytes (total: {pane.bytes_fed + len(data)})")
         pane.feed(data)
 
@@ -89,11 +100,19 @@ class PaneManager:
         if pane.action and pane.action.state == ActionState.WATCHING:
             pane.bytes_since_watching += len(data)
 
+        # Resolve pane info and the last-10-lines snapshot once per feed -
+        # the state, hook and busy checks below all read the same snapshot
+        info = None
+        snapshot = None
+        if pane.action or pane.process:
+            info = get_pane(pane_id)
+            snapshot = Pane.get(pane_id, pane, n=10, info=info)
+
         # Phase 1: Check state (for action resolution)
-        state = pane.check_patterns(self.patterns) if pane.action else None
+        state = pane.check_patterns(self.patterns, snapshot) if pane.action else None
 
         # Phase 2: Always check hooks (independent of action state)
-        self._check_hooks(pane_id, pane)
+        self._check_hooks(pane_id, pane, snapshot)
 
         # Phase 3: Handle action based on state
         if pane.action:
@@ -111,21 +130,19 @@ class PaneManager:
 
                 if is_auto_pair:
                     # Auto-pair mode: wait for busy pattern to appear then disappear
-                    from ..handler.patterns import compile_dsl
-
                     action_id = pane.action.id
                     assert pane.action.linked_busy_pattern is not None  # Guaranteed by is_auto_pair check
 
                     # Check if busy pattern is currently visible
                     busy_regex = compile_dsl(pane.action.linked_busy_pattern)
-                    busy_visible = bool(busy_regex.search(Pane.get(pane.pane_id, pane, n=10).content))
+                    busy_visible = bool(snapshot and busy_regex.search(snapshot.content))
 
                     if busy_visible:
                         self._busy_tracking[action_id] = True
                         logger.debug(f"Action {action_id}: busy pattern visible")
                     elif self._busy_tracking.get(action_id, False) and state == "ready":
                         # Busy was seen, now gone, ready matches → complete
-                        output = Pane.get(pane.pane_id, pane).content
+                        output = Pane.get(pane.pane_id, pane, info=info).content
                         truncated = False
                         logger.info(f"Action {action_id} completed (auto-pair): busy disappeared")
                         pane.action.result = {"output": output, "truncated": truncated}
@@ -141,7 +158,7 @@ class PaneManager:
                     # Normal mode: complete when ready pattern matches
                     # (Manual teaching completes via set_linked_busy RPC before reaching here)
                     action_id = pane.action.id
-                    output = Pane.get(pane.pane_id, pane).content
+                    output = Pane.get(pane.pane_id, pane, info=info).content
                     truncated = False
                     logger.info(f"Action {action_id} completed: output={len(output)} chars")
                     pane.action.result = {"output": output, "truncated": truncated}
@@ -164,17 +181,18 @@ class PaneManager:
 
                 # Don't clear pane.action - daemon will update it to WATCHING
 
-    def _check_hooks(self, pane_id: str, pane: PaneTerminal) -> None:
+    def _check_hooks(self, pane_id: str, pane: PaneTerminal, snapshot: Pane | None = None) -> None:
         """Check and fire matching hooks for pane.
 
         Args:
             pane_id: Pane identifier
             pane: PaneTerminal instance
+            snapshot: Last 10 lines already captured by the caller (captured if omitted)
         """
         if not pane.process:
             return
 
-        output = Pane.get(pane_id, pane, n=10).content
+        output = (snapshot or Pane.get(pane_id, pane, n=10)).content
         if not output:
             return
 
@@ -194,20 +212,15 @@ class PaneManager:
         Returns:
             True if pipe-pane is active, False on failure
         """
-        # Even if we think it's active, verify the pane still exists
+        # Even if we think it's active, verify the pipe is still attached (one tmux call)
         if pane_id in self._active_pipes:
-            from ..tmux.ops import get_pane
-
-            if get_pane(pane_id):
+            code, out, _ = run_tmux(["display", "-p", "-t", pane_id, "#{pane_pipe}"])
+            if code == 0 and out.strip() == "1":
                 return True
-            # Pane is gone, remove from tracking
+            # Pane is gone or its collector exited, remove from tracking
             self._active_pipes.discard(pane_id)
 
-        import sys
-        from ..tmux.core import run_tmux
-
-        cmd = f"{sys.executable} -m termtap.daemon.collector {pane_id}"
-        code, _, _ = run_tmux(["pipe-pane", "-t", pane_id, cmd])
+        code, _, _ = run_tmux(["pipe-pane", "-t", pane_id, f"{_COLLECTOR_CMD} {shlex.quote(pane_id)}"])
         if code == 0:
             self._active_pipes.add(pane_id)
             logger.info(f"Started pipe-pane collector for {pane_id}")
@@ -223,8 +236,6 @@ class PaneManager:
         """
         if pane_id not in self._active_pipes:
             return
-        from ..tmux.core import run_tmux
-
         run_tmux(["pipe-pane", "-t", pane_id])  # Empty stops it
         self._active_pipes.discard(pane_id)
 
@@ -248,9 +259,7 @@ class PaneManager:
         Returns:
             List of pane IDs that were removed
         """
-        from ..tmux.ops import list_panes
-
-        live_panes = {p.pane_id for p in list_panes()}
+        live_panes = list_pane_ids()
         dead = []
         for pane_id in list(self.panes.keys()):
             if pane_id not in live_panes:
@@ -4,9 +4,10 @@ PUBLIC API:
   - PaneTerminal: Terminal state for a single pane
 """
 
+import codecs
 import logging
-from dataclasses import dataclass
-from typing import cast
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
 
 import pyte
 
@@ -14,10 +15,15 @@ from ..daemon.queue import Action
 from ..handler.patterns import PatternStore
 from .slim_screen import SlimScreen
 
+if TYPE_CHECKING:
+    from ..pane import Pane
+
 __all__ = ["PaneTerminal"]
 
 logger = logging.getLogger(__name__)
 
+_Utf8Decoder = codecs.getincrementaldecoder("utf-8")
+
 
 @dataclass
 class PaneTerminal:
@@ -35,6 +41,10 @@ class PaneTerminal:
     bytes_fed: int = 0
     bytes_since_watching: int = 0  # Track data received since WATCHING started
     last_accessed: float = 0.0  # Unix timestamp of last intentional access
+    # Holds back a multi-byte character split across two pipe-pane reads
+    _decoder: codecs.IncrementalDecoder = field(
+        default_factory=lambda: _Utf8Decoder(errors="replace"), repr=False, init=False
+    )
 
     @classmethod
     def create(cls, pane_id: str, max_lines: int = 5000) -> "PaneTerminal":
@@ -58,18 +68,19 @@ class PaneTerminal:
         Args:
             data: Raw bytes from tmux pipe-pane
 
-        Decodes UTF-8 with replacement for invalid bytes,
+        Decodes UTF-8 incrementally (a character split across chunks is
+        completed by the next feed) with replacement for invalid bytes,
         then feeds through pyte.Stream to update screen.
         """
         self.bytes_fed += len(data)
         try:
-            text = data.decode("utf-8", errors="replace")
+            text = self._decoder.decode(data)
             logger.debug(f"Pane {self.pane_id} feeding {len(text)} chars to pyte")
             self.stream.feed(text)
         except Exception as e:
             logger.error(f"Pane {self.pane_id} pyte feed error: {e}")
 
-    def check_patterns(self, patterns: PatternStore) -> str | None:
+    def check_patterns(self, patterns: PatternStore, snapshot: "Pane | None" = None) -> str | None:
         """Check last N lines against patterns.
 
         Uses Pane abstraction which bundles content + process in sync.
@@ -77,6 +88,7 @@ class PaneTerminal:
 
         Args:
             patterns: Pattern store to match against
+            snapshot: Last 10 lines already captured by the caller (captured if omitted)
 
         Returns:
             "ready" if terminal is ready for input
@@ -85,7 +97,9 @@ class PaneTerminal:
         """
         from ..pane import Pane
 
-        if self.bytes_fed == 0:
+        if snapshot is not None:
+            pane = snapshot
+        elif self.bytes_fed == 0:
             # Stream empty, use tmux capture (last 10 lines for pattern matching)
             pane = Pane.capture_tail(self.pane_id, 10)
         else:
@@ -59,10 +59,16 @@ class SlimScreen:
         return self.base_idx + len(self.lines)
 
     def _trim_if_needed(self) -> None:
-        """Enforce max_lines, increment base_idx."""
-        while len(self.lines) > self.max_lines:
-            self.lines.pop(0)
-            self.base_idx += 1
+        """Enforce max_lines, increment base_idx.
+
+        Drops a small batch of extra old lines at once, so steady output doesn't
+        shift the whole list on every new line.
+        """
+        excess = len(self.lines) - self.max_lines
+        if excess > 0:
+            excess += self.max_lines // 64
+            del self.lines[:excess]
+            self.base_idx += excess
 
     def _ensure_row(self, row: int) -> None:
         """Ensure row exists (physical index, offset-adjusted)."""
@@ -2,11 +2,28 @@
 
 PUBLIC API:
   - run_tmux: Run tmux command and return result
+  - run_tmux_batch: Run several tmux commands in one tmux invocation
+  - popen_tmux: Start tmux command without waiting for it
 """
 
 import os
+import shutil
 import subprocess
 
+# Resolved once - saves a PATH search on every spawn (falls back to a lookup at exec time)
+_TMUX = shutil.which("tmux") or "tmux"
+
+# tmux sets these when it starts a process in a pane; they never change for this process
+_TMUX_ENV = os.environ.get("TMUX")
+_TMUX_PANE = os.environ.get("TMUX_PANE")
+
+# Result of the tmux lookup when TMUX_PANE is unset, set by _get_current_pane on success
+_current_pane: str | None = None
+
+# -u: tmux treats non-UTF-8 clients (e.g. LC_ALL=C) as unable to show control
+# characters and prints them as "_", which would break the tab-delimited formats
+_TMUX_CMD = [_TMUX, "-u"]
+
 
 def run_tmux(args: list[str]) -> tuple[int, str, str]:
     """Run tmux command and return result.
@@ -17,20 +34,72 @@ def run_tmux(args: list[str]) -> tuple[int, str, str]:
     Returns:
         Tuple of (returncode, stdout, stderr).
     """
-    cmd = ["tmux"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode, result.stdout, result.stderr
+    cmd = [*_TMUX_CMD, *args]
+    # Decode ourselves: tmux output is UTF-8 whatever the locale, and captured
+    # pane content may hold invalid bytes that text mode would raise on
+    result = subprocess.run(cmd, capture_output=True)
+    return result.returncode, result.stdout.decode("utf-8", "replace"), result.stderr.decode("utf-8", "replace")
+
+
+def popen_tmux(args: list[str], **kwargs) -> subprocess.Popen:
+    """Start tmux command without waiting for it.
+
+    For commands that take stdin or must not block. Uses the same resolved
+    binary as run_tmux.
+
+    Args:
+        args: Command arguments to pass to tmux.
+        **kwargs: Passed through to subprocess.Popen.
+
+    Returns:
+        The started process.
+    """
+    return subprocess.Popen([*_TMUX_CMD, *args], **kwargs)
+
+
+# Printed between batched commands to split their output apart again (the
+# record separator needs -u, see _TMUX_CMD, or tmux prints it as "_")
+_BATCH_MARKER = "\x1e--termtap-batch--\x1e"
+
+
+def run_tmux_batch(commands: list[list[str]]) -> tuple[int, list[str], str]:
+    """Run several tmux commands in one tmux invocation.
+
+    Commands are chained with tmux's ``;`` separator so the whole batch costs a
+    single process spawn and server round-trip. tmux stops at the first failing
+    command, so on error the output list only covers the commands that ran.
+
+    Args:
+        commands: Command argument lists, as passed to run_tmux.
+
+    Returns:
+        Tuple of (returncode, stdout per command, stderr).
+
+    Raises:
+        RuntimeError: If the output does not split into one part per command
+            that ran (e.g. the marker was mangled or appears in the output).
+    """
+    args: list[str] = []
+    for i, command in enumerate(commands):
+        if i:
+            args += [";", "display", "-p", _BATCH_MARKER, ";"]
+        args += command
+
+    code, stdout, stderr = run_tmux(args)
+    outputs = stdout.split(_BATCH_MARKER + "\n")
+    if len(outputs) > len(commands) or (code == 0 and len(outputs) != len(commands)):
+        raise RuntimeError(f"tmux batch output split into {len(outputs)} parts for {len(commands)} commands")
+    return code, outputs, stderr
 
 
-def _parse_format_line(line: str, delimiter: str = ":") -> dict:
-    """Parse tmux format string output into dict.
+def _parse_format_line(line: str, delimiter: str = ":") -> list[str]:
+    """Parse tmux format string output into positional fields.
 
     Args:
         line: Format string line to parse.
         delimiter: Field delimiter. Defaults to ':'.
     """
-    parts = line.strip().split(delimiter)
-    return {str(i): part for i, part in enumerate(parts)}
+    return line.strip().split(delimiter)
 
 
 def _check_tmux_available() -> bool:
@@ -41,13 +110,18 @@ def _check_tmux_available() -> bool:
 
 def _get_current_pane() -> str | None:
     """Get current tmux pane ID if inside tmux."""
-    if not os.environ.get("TMUX"):
+    global _current_pane
+    if not _TMUX_ENV:
         return None
-
-    code, stdout, _ = run_tmux(["display", "-p", "#{pane_id}"])
-    if code == 0:
-        return stdout.strip()
-    return None
+    # TMUX_PANE is set for processes started in a pane - no lookup needed
+    if _TMUX_PANE:
+        return _TMUX_PANE
+    if _current_pane is None:
+        code, stdout, _ = run_tmux(["display", "-p", "#{pane_id}"])
+        if code != 0:
+            return None  # not cached - a later call asks tmux again
+        _current_pane = stdout.strip()
+    return _current_pane
 
 
 def _is_current_pane(pane_id: str) -> bool:
@@ -3,9 +3,10 @@
 PUBLIC API:
   - PaneInfo: Complete pane information data class
   - list_panes: List all panes with full information
+  - list_pane_ids: List IDs of all live panes
   - get_pane: Get single pane by ID
   - get_client_for_pane: Get client name for a pane
-  - validate_pane_id: Validate pane ID format and existence
+  - validate_pane_id: Validate pane ID format and existence (re-exported from resolution)
   - get_pane_pid: Get process ID for pane
   - send_keys: Send keystrokes to pane
   - send_via_paste_buffer: Send content using paste buffer
@@ -15,22 +16,41 @@ PUBLIC API:
 """
 
 from dataclasses import dataclass
-import hashlib
-import json
+from operator import attrgetter
+import itertools
 import os
 import re
 import subprocess
+import time
 import warnings
 
-from .core import run_tmux, _get_current_pane, _is_current_pane
+from .core import run_tmux, run_tmux_batch, popen_tmux, _get_current_pane, _is_current_pane
 from ._exceptions import PaneNotFoundError, CurrentPaneError
+from .resolution import validate_pane_id  # noqa: F401
 from ..types import LineEnding
 
 # Type alias for session:window.pane format
 SessionWindowPane = str
 
+# list-panes -F format parsed by _query_panes
+_PANE_FORMAT = (
+    "#{pane_id}\t#{window_id}\t#{window_index}\t#{pane_index}\t#{pane_pid}\t#{pane_active}\t"
+    "#{session_name}\t#{pane_current_command}\t#{window_name}\t#{pane_title}"
+)
+_PANE_SORT_KEY = attrgetter("session", "window_index", "pane_index")
 
-@dataclass
+# Clients with the pane each is showing, parsed by _find_client (tab-delimited:
+# client names can hold any character, and run_tmux's -u keeps the tab intact)
+_LIST_CLIENTS_CMD = ["list-clients", "-F", "#{pane_id}\t#{client_name}"]
+
+# Client context outside tmux (copied per call - callers may mutate their dict)
+_EMPTY_CLIENT_CONTEXT = {"pane": "", "session": "", "window": "", "client": ""}
+
+# Per-process sequence for paste buffer names (tmux buffers are server-global)
+_paste_seq = itertools.count()
+
+
+@dataclass(slots=True, frozen=True)
 class PaneInfo:
     """Complete information about a tmux pane.
 
@@ -72,36 +92,72 @@ def build_client_context() -> dict[str, str]:
     """
     pane = os.environ.get("TMUX_PANE", "")
     if not pane:
-        return {"pane": "", "session": "", "window": "", "client": ""}
-
-    # Get pane info (includes session and window_id)
-    pane_info = get_pane(pane)
-    if not pane_info:
-        return {"pane": pane, "session": "", "window": "", "client": ""}
+        return dict(_EMPTY_CLIENT_CONTEXT)
 
-    session = pane_info.session
-    window_id = pane_info.window_id  # e.g., "@3"
+    # Session/window of the pane and the client list in one tmux call. display
+    # still succeeds for a pane that is gone, just with empty fields, so an
+    # empty window ID is what sends us to the empty context
+    code, outputs, _ = run_tmux_batch(
+        [["display", "-p", "-t", pane, "#{session_name}\t#{window_id}"], _LIST_CLIENTS_CMD]
+    )
+    session, _, window_id = outputs[0].strip().partition("\t")
+    if not window_id:
+        return dict(_EMPTY_CLIENT_CONTEXT, pane=pane)
 
-    # Get client name
-    client = get_client_for_pane(pane)
+    client = _find_client(outputs[1], pane) if code == 0 and len(outputs) > 1 else ""
 
     return {"pane": pane, "session": session, "window": window_id, "client": client}
 
 
-def validate_pane_id(pane_id: str) -> str | None:
-    """Validate pane ID exists.
+def _deprecated_enter(enter: bool, func_name: str) -> LineEnding:
+    """Warn about the deprecated 'enter' parameter and map it to a line ending.
+
+    Args:
+        enter: Value passed for the deprecated parameter.
+        func_name: Public function the caller used (for the warning text).
+    """
+    warnings.warn(
+        f"Parameter 'enter' is deprecated. Use 'line_ending' instead.\n"
+        f"  Old: {func_name}(..., enter={enter})\n"
+        f"  New: {func_name}(..., line_ending=LineEnding.{'LF' if enter else 'NONE'})",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return LineEnding.LF if enter else LineEnding.NONE
+
+
+# send-keys arguments per line ending
+_LINE_ENDING_KEYS: dict[str, tuple[str, ...]] = {
+    LineEnding.LF: ("Enter",),
+    LineEnding.CRLF: ("C-m", "C-j"),  # Ctrl-M (carriage return) then Ctrl-J (line feed)
+    LineEnding.CR: ("C-m",),  # Carriage return only
+}
 
-    Alias for resolution.validate_pane_id for use by server.py.
+
+def _send_line_ending(pane_id: str, line_ending: LineEnding | str, delay: float) -> bool:
+    """Send the keys that terminate a command.
 
     Args:
-        pane_id: Must be %id format (e.g., "%42")
+        pane_id: Target pane ID.
+        line_ending: Line ending to send (LineEnding.NONE or "" sends nothing).
+        delay: Delay in seconds before sending.
 
     Returns:
-        pane_id if valid, None if not found or invalid format
+        True if successful (or nothing to send).
     """
-    from .resolution import validate_pane_id as _validate
+    if not line_ending or line_ending == LineEnding.NONE:
+        return True
+
+    if delay > 0:
+        time.sleep(delay)
+
+    # StrEnum members hash like their values, so "lf" and LineEnding.LF share an entry
+    keys = _LINE_ENDING_KEYS.get(line_ending)
+    if keys is None:
+        return True
 
-    return _validate(pane_id)
+    code, _, _ = run_tmux(["send-keys", "-t", pane_id, *keys])
+    return code == 0
 
 
 def send_keys(
@@ -138,14 +194,7 @@ def send_keys(
 
     # Handle deprecated 'enter' parameter
     if enter is not None:
-        warnings.warn(
-            f"Parameter 'enter' is deprecated. Use 'line_ending' instead.\n"
-            f"  Old: send_keys(..., enter={enter})\n"
-            f"  New: send_keys(..., line_ending=LineEnding.{'LF' if enter else 'NONE'})",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        line_ending = LineEnding.LF if enter else LineEnding.NONE
+        line_ending = _deprecated_enter(enter, "send_keys")
 
     # Send the commands
     args = ["send-keys", "-t", pane_id]
@@ -160,25 +209,7 @@ def send_keys(
     if code != 0:
         return False
 
-    # Send appropriate line ending
-    if line_ending and line_ending != LineEnding.NONE:
-        if delay > 0:
-            import time
-
-            time.sleep(delay)
-
-        if line_ending == LineEnding.LF or line_ending == "lf":
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "Enter"])
-        elif line_ending == LineEnding.CRLF or line_ending == "crlf":
-            # Send Ctrl-M (carriage return) followed by Ctrl-J (line feed)
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "C-m", "C-j"])
-        elif line_ending == LineEnding.CR or line_ending == "cr":
-            # Send only Ctrl-M (carriage return)
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "C-m"])
-
-        return code == 0
-
-    return True
+    return _send_line_ending(pane_id, line_ending, delay)
 
 
 def send_via_paste_buffer(
@@ -206,51 +237,29 @@ def send_via_paste_buffer(
 
     # Handle deprecated 'enter' parameter
     if enter is not None:
-        warnings.warn(
-            f"Parameter 'enter' is deprecated. Use 'line_ending' instead.\n"
-            f"  Old: send_via_paste_buffer(..., enter={enter})\n"
-            f"  New: send_via_paste_buffer(..., line_ending=LineEnding.{'LF' if enter else 'NONE'})",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        line_ending = LineEnding.LF if enter else LineEnding.NONE
+        line_ending = _deprecated_enter(enter, "send_via_paste_buffer")
 
-    buffer_name = f"tt_{hashlib.md5(content.encode()).hexdigest()[:8]}"
+    buffer_name = f"tt_{os.getpid()}_{next(_paste_seq)}"
 
-    proc = subprocess.Popen(
-        ["tmux", "load-buffer", "-b", buffer_name, "-"],
+    # Bytes mode, encoded explicitly - tmux buffers are UTF-8 whatever the locale,
+    # and it skips the text-mode stream wrappers around each pipe
+    proc = popen_tmux(
+        ["load-buffer", "-b", buffer_name, "-"],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
     )
-    _, stderr = proc.communicate(input=content)
+    _, stderr = proc.communicate(input=content.encode())
 
     if proc.returncode != 0:
-        raise RuntimeError(f"Failed to load buffer: {stderr}")
+        raise RuntimeError(f"Failed to load buffer: {stderr.decode('utf-8', 'replace')}")
 
     code, _, stderr = run_tmux(["paste-buffer", "-t", pane_id, "-b", buffer_name, "-d", "-p"])
 
     if code != 0:
         raise RuntimeError(f"Failed to paste buffer: {stderr}")
 
-    # Send appropriate line ending
-    if line_ending and line_ending != LineEnding.NONE:
-        if delay > 0:
-            import time
-
-            time.sleep(delay)
-
-        if line_ending == LineEnding.LF or line_ending == "lf":
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "Enter"])
-        elif line_ending == LineEnding.CRLF or line_ending == "crlf":
-            # Send Ctrl-M (carriage return) followed by Ctrl-J (line feed)
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "C-m", "C-j"])
-        elif line_ending == LineEnding.CR or line_ending == "cr":
-            # Send only Ctrl-M (carriage return)
-            code, _, _ = run_tmux(["send-keys", "-t", pane_id, "C-m"])
-
-    return code == 0
+    return _send_line_ending(pane_id, line_ending, delay)
 
 
 def get_pane_pid(pane_id: str) -> int:
@@ -287,10 +296,9 @@ def get_pane(pane_id: str) -> PaneInfo | None:
     Returns:
         PaneInfo or None if not found.
     """
-    for pane in list_panes(all=True):
-        if pane.pane_id == pane_id:
-            return pane
-    return None
+    # -t resolves to the pane's window, the filter narrows it to the pane itself
+    panes = _query_panes(["list-panes", "-t", pane_id, "-f", f"#{{==:#{{pane_id}},{pane_id}}}"])
+    return panes[0] if panes else None
 
 
 def list_panes(all: bool = True, session: str | None = None, window: str | None = None) -> list[PaneInfo]:
@@ -313,62 +321,74 @@ def list_panes(all: bool = True, session: str | None = None, window: str | None
     elif all:
         cmd.append("-a")
 
-    # First run: Get all fields except pane_title as JSON (safe from escaping issues)
-    json_format = '{"pane_id":"#{pane_id}","session_name":"#{session_name}","window_id":"#{window_id}","window_index":"#{window_index}","window_name":"#{window_name}","pane_index":"#{pane_index}","pane_pid":"#{pane_pid}","pane_active":"#{pane_active}","pane_current_command":"#{pane_current_command}"}'
+    return _query_panes(cmd)
 
-    cmd.extend(["-F", json_format])
-    code, stdout, _ = run_tmux(cmd)
-    if code != 0:
-        return []
 
-    # Second run: Get just pane_titles in same order
-    title_cmd = ["list-panes"]
-    if window:
-        title_cmd.extend(["-t", window])
-    elif session:
-        title_cmd.extend(["-t", session])
-    elif all:
-        title_cmd.append("-a")
+def _query_panes(cmd: list[str]) -> list[PaneInfo]:
+    """Run a list-panes command and parse its panes.
 
-    title_cmd.extend(["-F", "#{pane_title}"])
-    _, title_stdout, _ = run_tmux(title_cmd)
+    Args:
+        cmd: list-panes arguments without -F (target/filter flags only).
+
+    Returns:
+        List of pane information objects, sorted by location.
+    """
+    # Tab-delimited: numeric/id fields first, free-text fields last and the split
+    # capped, so a tab inside a name can only shift the text fields after it -
+    # the numeric/id fields always parse
+    code, stdout, _ = run_tmux(cmd + ["-F", _PANE_FORMAT])
+    if code != 0:
+        return []
 
-    titles = title_stdout.strip().split("\n")
     panes = []
     current_pane_id = _get_current_pane()
 
-    for i, line in enumerate(stdout.strip().split("\n")):
-        if not line:
+    for line in stdout.split("\n"):
+        fields = line.split("\t", 9)
+        if len(fields) != 10:
             continue
-
-        try:
-            data = json.loads(line)
-            window_idx = int(data["window_index"])
-            pane_idx = int(data["pane_index"])
-
-            panes.append(
-                PaneInfo(
-                    pane_id=data["pane_id"],
-                    session=data["session_name"],
-                    window_id=data["window_id"],
-                    window_index=window_idx,
-                    window_name=data["window_name"] or str(window_idx),
-                    pane_index=pane_idx,
-                    pane_title=titles[i] if i < len(titles) else "",  # Get title by index
-                    pane_pid=int(data["pane_pid"]),
-                    pane_current_command=data.get("pane_current_command", ""),
-                    is_active=data["pane_active"] == "1",
-                    is_current=data["pane_id"] == current_pane_id,
-                    swp=f"{data['session_name']}:{window_idx}.{pane_idx}",
-                )
+        pane_id, window_id, window_index, pane_index, pane_pid, pane_active, session, command, window_name, title = (
+            fields
+        )
+        window_idx = int(window_index)
+        pane_idx = int(pane_index)
+
+        panes.append(
+            PaneInfo(
+                pane_id=pane_id,
+                session=session,
+                window_id=window_id,
+                window_index=window_idx,
+                window_name=window_name or window_index,
+                pane_index=pane_idx,
+                pane_title=title,
+                pane_pid=int(pane_pid),
+                pane_current_command=command,
+                is_active=pane_active == "1",
+                is_current=pane_id == current_pane_id,
+                swp=f"{session}:{window_idx}.{pane_idx}",
             )
-        except (json.JSONDecodeError, KeyError, ValueError, IndexError):
-            continue
+        )
 
-    panes.sort(key=lambda p: (p.session, p.window_index, p.pane_index))
+    panes.sort(key=_PANE_SORT_KEY)
     return panes
 
 
+def list_pane_ids() -> set[str]:
+    """List IDs of all live panes.
+
+    Cheaper than list_panes when only existence matters: one format field
+    and no per-pane parsing.
+
+    Returns:
+        Set of pane IDs (%format).
+    """
+    code, stdout, _ = run_tmux(["list-panes", "-a", "-F", "#{pane_id}"])
+    if code != 0:
+        return set()
+    return set(stdout.split())
+
+
 def get_client_for_pane(pane_id: str) -> str:
     """Get client name for a specific pane.
 
@@ -378,23 +398,29 @@ def get_client_for_pane(pane_id: str) -> str:
     Returns:
         Client name (e.g. '/dev/pts/3') or empty string if not found.
     """
-    json_format = '{"pane_id":"#{pane_id}","client_name":"#{client_name}"}'
-    cmd = ["list-clients", "-F", json_format]
-    code, stdout, _ = run_tmux(cmd)
+    code, stdout, _ = run_tmux(_LIST_CLIENTS_CMD)
 
     if code != 0:
         return ""
 
-    for line in stdout.strip().split("\n"):
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            if data["pane_id"] == pane_id:
-                return data["client_name"]
-        except (json.JSONDecodeError, KeyError):
-            continue
+    return _find_client(stdout, pane_id)
+
 
+def _find_client(stdout: str, pane_id: str) -> str:
+    """Find the client showing a pane in _LIST_CLIENTS_CMD output.
+
+    Args:
+        stdout: Output of _LIST_CLIENTS_CMD.
+        pane_id: Pane ID (e.g. '%42').
+
+    Returns:
+        Client name or empty string if not found.
+    """
+    # Lines are "<pane_id>\t<client_name>" - the tab keeps %4 from matching %42
+    prefix = f"{pane_id}\t"
+    for line in stdout.split("\n"):
+        if line.startswith(prefix):
+            return line[len(prefix) :]
     return ""
 
 
@@ -407,15 +433,15 @@ _ESCAPE_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07]*(?:\x07|\x1b\\)|[
 
 def __strip_trailing_empty_lines(content: str) -> str:
     """Strip tmux pane height padding lines."""
-    if not content:
+    # Last non-whitespace char marks the last real line; keep through its newline
+    end = len(content.rstrip())
+    if not end:
         return ""
 
-    lines = content.splitlines()
-    while lines and not lines[-1].strip():
-        lines.pop()
-    if lines:
-        return "\n".join(lines) + "\n"
-    return ""
+    newline = content.find("\n", end)
+    if newline < 0:
+        return content + "\n"
+    return content[: newline + 1]
 
 
 def capture_pane(pane_id: str) -> str:
@@ -436,7 +462,8 @@ def capture_pane(pane_id: str) -> str:
     code, stdout, _ = run_tmux(["capture-pane", "-t", pane_id, "-p", "-S", "-"])
     if code != 0:
         return ""
-    cleaned = _ESCAPE_RE.sub("", stdout)
+    # Leaked escapes are rare - skip the regex pass when there is no ESC at all
+    cleaned = _ESCAPE_RE.sub("", stdout) if "\x1b" in stdout else stdout
     return __strip_trailing_empty_lines(cleaned)
 
 
@@ -451,29 +478,12 @@ def create_panes_with_layout(session: str, num_panes: int, layout: str = "even-h
     if num_panes < 2:
         raise RuntimeError("Failed to create layout: need at least 2 panes")
 
-    pane_ids = []
-
-    code, stdout, _ = run_tmux(["list-panes", "-t", f"{session}:0", "-F", "#{pane_id}"])
-    if code == 0:
-        pane_ids.append(stdout.strip())
-
+    # Existing pane, the splits and the layout all go to tmux as one batch
+    commands = [["list-panes", "-t", f"{session}:0", "-F", "#{pane_id}"]]
     for i in range(1, num_panes):
-        code, stdout, _ = run_tmux(["split-window", "-t", f"{session}:0.{i - 1}", "-P", "-F", "#{pane_id}"])
-        if code == 0:
-            pane_ids.append(stdout.strip())
+        commands.append(["split-window", "-t", f"{session}:0.{i - 1}", "-P", "-F", "#{pane_id}"])
+    commands.append(["select-layout", "-t", f"{session}:0", layout])
 
-    __apply_layout(session, layout)
-
-    return pane_ids
-
-
-def __apply_layout(session: str, layout: str, window: int = 0) -> bool:
-    """Apply layout to window.
-
-    Args:
-        session: Session name.
-        layout: Layout name.
-        window: Window index.
-    """
-    code, _, _ = run_tmux(["select-layout", "-t", f"{session}:{window}", layout])
-    return code == 0
+    # tmux stops at the first failure - keep the IDs of the panes that exist
+    _, outputs, _ = run_tmux_batch(commands)
+    return [out.strip() for out in outputs[:num_panes] if out.strip()]
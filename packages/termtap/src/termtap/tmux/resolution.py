@@ -1,12 +1,22 @@
 """Pane ID validation - verify pane ID exists in tmux.
 
 PUBLIC API:
+  - is_pane_id: Check pane ID format without calling tmux
   - validate_pane_id: Validate pane ID format and existence
 """
 
 from .core import run_tmux
 
-__all__ = ["validate_pane_id"]
+__all__ = ["is_pane_id", "validate_pane_id"]
+
+
+def is_pane_id(pane_id: str) -> bool:
+    """Check pane ID is in %id format (e.g., "%42").
+
+    Args:
+        pane_id: Pane ID to check.
+    """
+    return pane_id.startswith("%") and pane_id[1:].isdigit()
 
 
 def validate_pane_id(pane_id: str) -> str | None:
@@ -18,7 +28,8 @@ def validate_pane_id(pane_id: str) -> str | None:
     Returns:
         pane_id if valid, None if not found or invalid format
     """
-    if not pane_id.startswith("%"):
+    # Reject malformed IDs without spawning tmux
+    if not is_pane_id(pane_id):
         return None
     code, _, _ = run_tmux(["list-panes", "-t", pane_id, "-F", "#{pane_id}"])
     return pane_id if code == 0 else None
@@ -13,7 +13,7 @@ from textual.app import App
 from textual.timer import Timer
 
 from ..paths import EVENTS_SOCKET_PATH, SOCKET_PATH
-from .screens import PaneSelectScreen, PatternScreen, QueueScreen
+from .screens import PaneSelectScreen, PatternScreen, QueueScreen, create_action_screen
 
 __all__ = ["TermtapCompanion", "run_companion"]
 
@@ -35,16 +35,6 @@ class TermtapCompanion(App):
         self._queue_screen: QueueScreen | None = None
         self._exit_timer: Timer | None = None
 
-    def _create_action_screen(self, action: dict):
-        """Create appropriate screen for action state."""
-        state = action.get("state", "")
-        if state == "selecting_pane":
-            # Pane selection needed
-            return PaneSelectScreen(action, multi_select=action.get("multi_select", False))
-        else:
-            # Pattern marking (ready_check or watching)
-            return PatternScreen(action)
-
     def on_mount(self) -> None:
         """Initialize with QueueScreen and start event listener."""
         self.title = "Termtap Companion"
@@ -79,7 +69,7 @@ class TermtapCompanion(App):
 
                 # Auto-open first action if any
                 if actions:
-                    self.push_screen(self._create_action_screen(actions[-1]))
+                    self.push_screen(create_action_screen(actions[-1]))
 
                 # Exit in popup mode if no actions
                 if self.popup_mode and not actions:
@@ -145,7 +135,7 @@ class TermtapCompanion(App):
 
                 # Auto-open if on queue screen
                 if isinstance(self.screen, QueueScreen):
-                    self.push_screen(self._create_action_screen(action))
+                    self.push_screen(create_action_screen(action))
 
         elif event_type == "action_watching":
             action = event.get("action")
@@ -159,7 +149,7 @@ class TermtapCompanion(App):
                     current_action_id = getattr(self.screen, "action", {}).get("id")
                     if current_action_id == action.get("id"):
                         self.pop_screen()
-                        self.push_screen(self._create_action_screen(action))
+                        self.push_screen(create_action_screen(action))
 
         elif event_type == "action_resolved":
             resolved_id = event.get("id")
@@ -172,7 +162,7 @@ class TermtapCompanion(App):
                 if isinstance(self.screen, (PaneSelectScreen, PatternScreen)):
                     self.pop_screen()
                     if actions:
-                        self.push_screen(self._create_action_screen(actions[0]))
+                        self.push_screen(create_action_screen(actions[0]))
 
                 # Delayed exit in popup mode - wait for potential follow-up actions
                 if self.popup_mode and not actions:
@@ -191,7 +181,7 @@ class TermtapCompanion(App):
                 if current_action_id == cancelled_id:
                     self.pop_screen()
                     if self._queue_screen and self._queue_screen.actions:
-                        self.push_screen(self._create_action_screen(self._queue_screen.actions[0]))
+                        self.push_screen(create_action_screen(self._queue_screen.actions[0]))
 
             # Handle popup mode exit
             if self.popup_mode and self._queue_screen and not self._queue_screen.actions:
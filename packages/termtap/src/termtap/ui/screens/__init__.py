@@ -2,6 +2,7 @@
 
 PUBLIC API:
   - QueueScreen: Home screen showing pending actions
+  - create_action_screen: Build the screen that handles an action
   - PaneSelectScreen: Select pane(s) from available panes
   - PatternScreen: Mark patterns for state detection
   - PatternListScreen: View and manage learned patterns
@@ -14,10 +15,11 @@ from .pane_select_screen import PaneSelectScreen
 from .pattern_editor_screen import PatternEditorScreen
 from .pattern_list_screen import PatternListScreen
 from .pattern_screen import PatternScreen
-from .queue_screen import QueueScreen
+from .queue_screen import QueueScreen, create_action_screen
 
 __all__ = [
     "QueueScreen",
+    "create_action_screen",
     "PaneSelectScreen",
     "PatternScreen",
     "PatternListScreen",
@@ -4,6 +4,8 @@ PUBLIC API:
   - TermtapScreen: Base screen with common patterns
 """
 
+import asyncio
+
 from textual.screen import Screen
 
 from ...client import DaemonClient
@@ -40,6 +42,11 @@ class TermtapScreen(Screen):
             self._client = DaemonClient(auto_start=False)
         return self._client
 
+    def on_unmount(self) -> None:
+        """Close this screen's daemon connection once it leaves the stack."""
+        if self._client is not None:
+            self._client.close()
+
     def action_back(self) -> None:
         """Default back action - pop screen."""
         self.app.pop_screen()
@@ -50,3 +57,11 @@ class TermtapScreen(Screen):
             return self.client.call(method, params)
         except Exception:
             return None
+
+    async def rpc_async(self, method: str, params: dict | None = None) -> dict | None:
+        """Make RPC call on a worker thread so the UI keeps rendering meanwhile.
+
+        Same result as rpc(). Callers should check is_attached afterwards - the
+        screen may have been dismissed while the call was in flight.
+        """
+        return await asyncio.to_thread(self.rpc, method, params)
@@ -4,10 +4,12 @@ PUBLIC API:
   - PaneSelectScreen: Select a pane from available panes
 """
 
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.widgets import Footer, OptionList, Static
+from textual.worker import get_current_worker
 
 from rich.text import Text
 
@@ -58,14 +60,15 @@ class PaneSelectScreen(TermtapScreen):
                 yield FzfSelector([], multi_select=self.multi_select)
             yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Load pane list from daemon."""
         # Show preview by default using Python display property
         preview = self.query_one("#preview")
         preview.display = True
 
-        result = self.rpc("ls")
-        if result:
+        # Screen renders (empty list) while the daemon answers
+        result = await self.rpc_async("ls")
+        if result and self.is_attached:
             self._all_panes = result.get("panes", [])
             self._update_pane_list()
 
@@ -82,25 +85,27 @@ class PaneSelectScreen(TermtapScreen):
                 filtered = panes
             panes = filtered
 
-        # Calculate max widths for alignment
-        max_session = max((len(p.get("session", "")) for p in panes), default=0)
-        max_pane_idx = max((len(f"{p['window_index']}.{p['pane_index']}") for p in panes), default=0)
-
-        # Build FzfItems
-        items = []
+        # Extract row fields and the max widths for alignment in one pass
+        rows = []
+        max_session = max_pane_idx = 0
         for p in panes:
             session = p.get("session", "")
             pane_idx = f"{p['window_index']}.{p['pane_index']}"
-            process = p.get("pane_current_command", "")
-            pane_id = p.get("pane_id", "")
+            rows.append((session, pane_idx, p.get("pane_current_command", ""), p.get("pane_id", "")))
+            max_session = max(max_session, len(session))
+            max_pane_idx = max(max_pane_idx, len(pane_idx))
 
-            # Display: Rich Text with theme-aware markup
-            label = Text()
-            label.append(session.ljust(max_session), style="bold")
-            label.append("  ")
-            label.append(pane_idx.ljust(max_pane_idx), style="dim")
-            label.append("  ")
-            label.append(process, style="italic")
+        # Build FzfItems
+        items = []
+        for session, pane_idx, process, pane_id in rows:
+            # Display: Rich Text built in one call (plain spans, no markup parsing)
+            label = Text.assemble(
+                (session.ljust(max_session), "bold"),
+                "  ",
+                (pane_idx.ljust(max_pane_idx), "dim"),
+                "  ",
+                (process, "italic"),
+            )
 
             # Search: concatenate searchable fields
             search_text = f"{session} {pane_idx} {process}"
@@ -162,11 +167,22 @@ class PaneSelectScreen(TermtapScreen):
         pane_id = selector.get_highlighted_value()
 
         if pane_id:
-            pane = Pane.capture_tail(pane_id, lines)
-            preview.set_content(pane.content)
+            self._load_preview(preview, pane_id, lines)
         else:
+            self.workers.cancel_group(self, "preview")
             preview.set_content("(no pane selected)")
 
+    @work(thread=True, exclusive=True, group="preview")
+    def _load_preview(self, preview: PreviewPane, pane_id: str, lines: int) -> None:
+        """Capture preview content off the UI thread.
+
+        Exclusive, so a newer highlight cancels the pending one and a stale
+        capture never overwrites the current preview.
+        """
+        content = Pane.capture_tail(pane_id, lines).content
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(preview.set_content, content)
+
     def _resolve_action(self, result: dict) -> None:
         """Send resolve RPC and pop screen."""
         action_id = self.action.get("id")
@@ -4,6 +4,8 @@ PUBLIC API:
   - PatternListScreen: View and manage learned patterns
 """
 
+from functools import lru_cache
+
 from rich.console import Group
 from rich.panel import Panel
 from rich.text import Text
@@ -12,11 +14,38 @@ from textual.containers import Vertical
 from textual.widgets import Footer, Static
 
 from ._base import TermtapScreen
+from .pattern_editor_screen import PatternEditorScreen
 from ..widgets.fzf_selector import FzfSelector, FzfItem
 
 __all__ = ["PatternListScreen"]
 
 
+# Panels are only read when rendered, so identical ones are shared across
+# reloads (every delete reloads the list) instead of rebuilt
+@lru_cache(maxsize=512)
+def _pattern_panel(process: str, state: str, pattern: str, border_color: str) -> Panel:
+    """Build (or reuse) the Rich Panel for a standalone pattern."""
+    title = Text(f"{process}: {state}", style="bold")
+    content = Text(pattern)  # No escape needed - Text() is literal
+
+    return Panel(Group(title, content), border_style=border_color, padding=(0, 1))
+
+
+@lru_cache(maxsize=512)
+def _pair_panel(process: str, ready: str, busy: str, ready_color: str, busy_color: str, border_color: str) -> Panel:
+    """Build (or reuse) the Rich Panel for a pattern pair."""
+    title = Text(f"{process}: Pair", style="bold")
+
+    # Build content with theme colors - no escape needed for Text()
+    ready_line = Text("Ready: ", style=f"bold {ready_color}")
+    ready_line.append(ready)  # Text.append() is literal
+
+    busy_line = Text("Busy:  ", style=f"bold {busy_color}")
+    busy_line.append(busy)  # Text.append() is literal
+
+    return Panel(Group(title, ready_line, busy_line), border_style=border_color, padding=(0, 1))
+
+
 def _build_pattern_item(process: str, state: str, pattern: str, index: int, theme_vars: dict[str, str]) -> FzfItem:
     """Build FzfItem for a standalone pattern with theme-aware Rich Panel.
 
@@ -33,10 +62,7 @@ def _build_pattern_item(process: str, state: str, pattern: str, index: int, them
     # Use theme colors for borders
     border_color = theme_vars.get("success", "#8AD4A1") if state == "ready" else theme_vars.get("warning", "#FFC473")
 
-    title = Text(f"{process}: {state}", style="bold")
-    content = Text(pattern)  # No escape needed - Text() is literal
-
-    display = Panel(Group(title, content), border_style=border_color, padding=(0, 1))
+    display = _pattern_panel(process, state, pattern, border_color)
 
     # Search on process, state, and pattern content
     search_text = f"{process} {state} {pattern}"
@@ -57,17 +83,13 @@ def _build_pair_item(process: str, ready: str, busy: str, index: int, theme_vars
     Returns:
         FzfItem with Rich Panel using theme colors
     """
-    title = Text(f"{process}: Pair", style="bold")
-
-    # Build content with theme colors - no escape needed for Text()
-    ready_line = Text("Ready: ", style=f"bold {theme_vars.get('success', '#8AD4A1')}")
-    ready_line.append(ready)  # Text.append() is literal
-
-    busy_line = Text("Busy:  ", style=f"bold {theme_vars.get('warning', '#FFC473')}")
-    busy_line.append(busy)  # Text.append() is literal
-
-    display = Panel(
-        Group(title, ready_line, busy_line), border_style=theme_vars.get("primary", "#0178D4"), padding=(0, 1)
+    display = _pair_panel(
+        process,
+        ready,
+        busy,
+        theme_vars.get("success", "#8AD4A1"),
+        theme_vars.get("warning", "#FFC473"),
+        theme_vars.get("primary", "#0178D4"),
     )
 
     # Search on process and both patterns
@@ -106,9 +128,14 @@ class PatternListScreen(TermtapScreen):
         """Fetch and display patterns when screen mounts."""
         self._load_patterns()
 
-    def _load_patterns(self) -> None:
-        """Fetch patterns from daemon and populate list."""
-        result = self.rpc("get_patterns")
+    def _load_patterns(self, result: dict | None = None) -> None:
+        """Fetch patterns from daemon and populate list.
+
+        Args:
+            result: RPC result already carrying "patterns" (fetched if omitted)
+        """
+        if result is None or "patterns" not in result:
+            result = self.rpc("get_patterns")
         patterns = result.get("patterns", {}) if result else {}
 
         # Get theme colors from app (hex strings)
@@ -173,8 +200,6 @@ class PatternListScreen(TermtapScreen):
             patterns = result.get("patterns", {}) if result else {}
             config = patterns.get(process, {})
 
-            from .pattern_editor_screen import PatternEditorScreen
-
             self.app.push_screen(PatternEditorScreen(process=process, initial_config=config))
         except (ValueError, IndexError):
             pass
@@ -195,12 +220,13 @@ class PatternListScreen(TermtapScreen):
 
             if item_type == "pair":
                 ready, busy = data
-                self.rpc("remove_pair", {"process": process, "ready": ready, "busy": busy})
+                result = self.rpc("remove_pair", {"process": process, "ready": ready, "busy": busy})
             else:  # standalone
                 state, pattern = data
-                self.rpc("remove_pattern", {"process": process, "pattern": pattern, "state": state})
+                result = self.rpc("remove_pattern", {"process": process, "pattern": pattern, "state": state})
 
-            self._load_patterns()
+            # Removal replies with the updated patterns - refresh from those
+            self._load_patterns(result)
         except (ValueError, IndexError):
             pass
 
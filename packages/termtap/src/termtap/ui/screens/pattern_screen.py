@@ -10,6 +10,7 @@ from textual.containers import VerticalScroll
 from textual.widgets import Footer, Static
 
 from ._base import TermtapScreen
+from .dsl_syntax_screen import DslSyntaxScreen
 from ..widgets import DslReference, OutputPane, PatternEditor
 
 __all__ = ["PatternScreen"]
@@ -59,12 +60,12 @@ class PatternScreen(TermtapScreen):
         """Schedule data load after layout is complete."""
         self.call_after_refresh(self._load_live_data)
 
-    def on_resize(self, event) -> None:
+    async def on_resize(self, event) -> None:
         """Retry data load when size becomes known."""
         if not self._data_loaded and event.size.height > 0:
-            self._load_live_data()
+            await self._load_live_data()
 
-    def _load_live_data(self) -> None:
+    async def _load_live_data(self) -> None:
         """Fetch live pane data from daemon."""
         if self._data_loaded:
             return
@@ -81,9 +82,10 @@ class PatternScreen(TermtapScreen):
 
         self._data_loaded = True
 
-        result = self.rpc("get_pane_data", {"pane_id": pane_id, "lines": lines})
+        # Screen stays responsive while the daemon captures the pane
+        result = await self.rpc_async("get_pane_data", {"pane_id": pane_id, "lines": lines})
 
-        if result:
+        if result and self.is_attached:
             # Update display widgets
             self._current_process = result.get("process", "unknown")
             self._update_process_header()
@@ -120,13 +122,13 @@ class PatternScreen(TermtapScreen):
         if not editor.undo_entry():
             self.notify("No entries to undo")
 
-    def action_refresh(self) -> None:
+    async def action_refresh(self) -> None:
         """Refresh pane output and clear pattern."""
-        # Reset data loaded flag and reload
-        self._data_loaded = False
-        self._load_live_data()
         editor = self.query_one(PatternEditor)
         editor.clear_pattern()
+        # Reset data loaded flag and reload
+        self._data_loaded = False
+        await self._load_live_data()
 
     def action_back(self) -> None:
         """Go back to queue."""
@@ -134,8 +136,6 @@ class PatternScreen(TermtapScreen):
 
     def action_show_syntax(self) -> None:
         """Show full DSL syntax reference."""
-        from .dsl_syntax_screen import DslSyntaxScreen
-
         self.app.push_screen(DslSyntaxScreen())
 
     def action_resolve_ready(self) -> None:
@@ -166,20 +166,16 @@ class PatternScreen(TermtapScreen):
         # Learn pattern ONLY if NOT in pair mode
         # (In pair mode, pattern will be learned as a pair when busy is marked)
         if pattern and not pair_mode:
-            pane_id = self.action.get("pane_id")
-            if pane_id:
-                pane_data = self.rpc("get_pane_data", {"pane_id": pane_id})
-                if pane_data:
-                    process_name = pane_data.get("process")
-                    if process_name:
-                        self.rpc(
-                            "learn_pattern",
-                            {
-                                "process": process_name,
-                                "pattern": pattern,
-                                "state": state,
-                            },
-                        )
+            process_name = self._pane_process()
+            if process_name:
+                self.rpc(
+                    "learn_pattern",
+                    {
+                        "process": process_name,
+                        "pattern": pattern,
+                        "state": state,
+                    },
+                )
 
         # Then resolve (which transitions to WATCHING state)
         result: dict = {"state": state, "pair_mode": pair_mode}
@@ -187,6 +183,21 @@ class PatternScreen(TermtapScreen):
             result["pattern"] = pattern
         self._resolve_action(result)
 
+    def _pane_process(self) -> str | None:
+        """Process the pattern was marked against.
+
+        Reuses the process from the loaded pane data; only asks the daemon
+        when the data hasn't loaded yet.
+        """
+        if self._current_process != "unknown":
+            return self._current_process
+
+        pane_id = self.action.get("pane_id")
+        if not pane_id:
+            return None
+        pane_data = self.rpc("get_pane_data", {"pane_id": pane_id})
+        return pane_data.get("process") if pane_data else None
+
     def _set_linked_busy(self) -> None:
         """Set linked busy pattern and complete action immediately."""
         editor = self.query_one(PatternEditor)
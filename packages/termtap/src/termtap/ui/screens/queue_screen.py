@@ -2,6 +2,7 @@
 
 PUBLIC API:
   - QueueScreen: DataTable of pending actions with navigation
+  - create_action_screen: Build the screen that handles an action
 """
 
 from textual.app import ComposeResult
@@ -9,9 +10,15 @@ from textual.containers import Vertical
 from textual.widgets import DataTable, Footer, Static
 
 from ._base import TermtapScreen
+from .pane_select_screen import PaneSelectScreen
+from .pattern_list_screen import PatternListScreen
+from .pattern_screen import PatternScreen
 from ..widgets import Background, LogoText
 
-__all__ = ["QueueScreen"]
+__all__ = ["QueueScreen", "create_action_screen"]
+
+# Longest command shown in the queue table; longer ones end in "..."
+_CMD_MAX = 40
 
 # Pre-rendered termtap logo (ansi_shadow font, 6 lines x 61 chars)
 LOGO_TEXT = r"""████████╗███████╗██████╗ ███╗   ███╗████████╗ █████╗ ██████╗
@@ -22,6 +29,22 @@ LOGO_TEXT = r"""████████╗███████╗████
    ╚═╝   ╚══════╝╚═╝  ╚═╝╚═╝     ╚═╝   ╚═╝   ╚═╝  ╚═╝╚═╝"""
 
 
+def create_action_screen(action: dict) -> TermtapScreen:
+    """Create appropriate screen for action state.
+
+    Args:
+        action: Action dict from the daemon queue
+
+    Returns:
+        PaneSelectScreen for pane selection, PatternScreen otherwise
+    """
+    if action.get("state", "") == "selecting_pane":
+        return PaneSelectScreen(action, multi_select=action.get("multi_select", False))
+
+    # Pattern marking (ready_check or watching)
+    return PatternScreen(action)
+
+
 class QueueScreen(TermtapScreen):
     """Home screen showing pending actions queue.
 
@@ -39,6 +62,9 @@ class QueueScreen(TermtapScreen):
     def __init__(self):
         super().__init__()
         self.actions: list[dict] = []
+        self._actions_by_id: dict[str, dict] = {}
+        self._rows: dict[str, tuple[str, ...]] = {}  # action_id -> cells currently in the table
+        self._columns: list = []
 
     def compose(self) -> ComposeResult:
         with Background(dim=False):
@@ -58,7 +84,7 @@ class QueueScreen(TermtapScreen):
     def on_mount(self) -> None:
         """Setup table columns."""
         table = self.query_one("#queue-table", DataTable)
-        table.add_columns("ID", "Pane", "State", "Command")
+        self._columns = table.add_columns("ID", "Pane", "State", "Command")
         table.cursor_type = "row"
         self._refresh_display()
 
@@ -75,6 +101,7 @@ class QueueScreen(TermtapScreen):
     def set_actions(self, actions: list[dict]) -> None:
         """Update actions list and refresh display."""
         self.actions = actions
+        self._actions_by_id = {action["id"]: action for action in actions if action.get("id")}
         self._refresh_display()
 
     def _refresh_display(self) -> None:
@@ -82,46 +109,54 @@ class QueueScreen(TermtapScreen):
         table = self.query_one("#queue-table", DataTable)
         title = self.query_one(".screen-title", Static)
 
-        table.clear()
-
         has_actions = bool(self.actions)
 
         title.display = has_actions
         table.display = has_actions
 
-        if has_actions:
-            for action in self.actions:
-                cmd = action.get("command", "")
-                if len(cmd) > 40:
-                    cmd = cmd[:37] + "..."
-                table.add_row(
-                    action.get("id", "")[:8],
-                    action.get("pane_id", "") or "(select)",
-                    action.get("state", ""),
-                    cmd,
-                    key=action.get("id"),
-                )
+        rows = {action.get("id", ""): self._row_cells(action) for action in self.actions}
+
+        # Diff against what's displayed - only touch rows that changed. Rows must
+        # stay in queue order (cancel indexes self.actions by cursor row), so if
+        # surviving rows were reordered fall back to a full rebuild.
+        kept = [action_id for action_id in self._rows if action_id in rows]
+        if list(rows)[: len(kept)] != kept:
+            table.clear()
+            self._rows = {}
+
+        for action_id in self._rows.keys() - rows.keys():
+            table.remove_row(action_id)
+
+        for action_id, cells in rows.items():
+            old = self._rows.get(action_id)
+            if old is None:
+                table.add_row(*cells, key=action_id)
+            elif old != cells:
+                for column, old_value, value in zip(self._columns, old, cells):
+                    if old_value != value:
+                        table.update_cell(action_id, column, value, update_width=True)
+
+        self._rows = rows
+
+    @staticmethod
+    def _row_cells(action: dict) -> tuple[str, ...]:
+        """Table cells (ID, Pane, State, Command) for an action."""
+        cmd = action.get("command", "")
+        if len(cmd) > _CMD_MAX:
+            cmd = cmd[: _CMD_MAX - 3] + "..."
+        return (
+            action.get("id", "")[:8],
+            action.get("pane_id", "") or "(select)",
+            action.get("state", ""),
+            cmd,
+        )
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection - open appropriate action screen."""
         if event.row_key:
-            action_id = str(event.row_key.value)
-            for action in self.actions:
-                if action.get("id") == action_id:
-                    self._open_action_screen(action)
-                    break
-
-    def _open_action_screen(self, action: dict) -> None:
-        """Open appropriate screen for action state."""
-        state = action.get("state", "")
-        if state == "selecting_pane":
-            from .pane_select_screen import PaneSelectScreen
-
-            self.app.push_screen(PaneSelectScreen(action, multi_select=action.get("multi_select", False)))
-        else:
-            from .pattern_screen import PatternScreen
-
-            self.app.push_screen(PatternScreen(action))
+            action = self._actions_by_id.get(str(event.row_key.value))
+            if action:
+                self.app.push_screen(create_action_screen(action))
 
     def action_noop(self) -> None:
         """Do nothing - used to suppress inherited bindings."""
@@ -133,8 +168,6 @@ class QueueScreen(TermtapScreen):
 
     def action_patterns(self) -> None:
         """Open pattern management screen."""
-        from .pattern_list_screen import PatternListScreen
-
         self.app.push_screen(PatternListScreen())
 
     def action_cancel_action(self) -> None:
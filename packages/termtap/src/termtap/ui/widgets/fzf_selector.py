@@ -36,6 +36,11 @@ class FzfItem(NamedTuple):
     search: str
 
 
+def _lower_search(items: list[FzfItem]) -> list[FzfItem]:
+    """Lowercase each item's search text for case-insensitive matching."""
+    return [item._replace(search=item.search.lower()) for item in items]
+
+
 class FzfSelector(Vertical):
     """FZF-style selector - type to filter, arrows to navigate.
 
@@ -96,13 +101,18 @@ class FzfSelector(Vertical):
             classes: CSS classes
         """
         super().__init__(name=name, id=id, classes=classes)
+        items = _lower_search(items)
         self._all_items = items
         self._filtered = items.copy()
         self._query = ""
+        # _pools[i]: items matching the first i query chars, in original order
+        self._pools: list[list[FzfItem]] = [items]
         self._multi_select = multi_select
         self._empty_message = empty_message
         self._selected: set[str] = set()
-        self._fuzzy = FuzzySearch(case_sensitive=False)
+        # Search text is lowercased once on intake and the query once per
+        # keystroke, so the matcher needn't lowercase both on every item
+        self._fuzzy = FuzzySearch(case_sensitive=True)
 
     def compose(self) -> ComposeResult:
         """Compose child widgets."""
@@ -199,15 +209,23 @@ class FzfSelector(Vertical):
         query_label = self.query_one("#query-display", Label)
         query_label.update(f"Query: {self._query}" if self._query else "")
 
+        # Drop pools for chars removed by backspace
+        del self._pools[len(self._query) + 1 :]
+
         if not self._query:
             self._filtered = self._all_items.copy()
         else:
-            # Use FuzzySearch to score and rank matches
+            # A fuzzy match for the query also matches every prefix of it, so
+            # typing narrows the previous pool instead of rescanning every item
+            pool = self._pools[-1]
+            query = self._query.lower()
             matches = []
-            for item in self._all_items:
-                score, _ = self._fuzzy.match(self._query, item.search)
+            for item in pool:
+                score, _ = self._fuzzy.match(query, item.search)
                 if score > 0:
                     matches.append((score, item))
+            if len(self._pools) <= len(self._query):
+                self._pools.append([item for _, item in matches])
             # Sort by score (descending)
             matches.sort(key=lambda x: -x[0])
             self._filtered = [item for _, item in matches]
@@ -271,9 +289,11 @@ class FzfSelector(Vertical):
         Args:
             items: New list of FzfItem items.
         """
+        items = _lower_search(items)
         self._all_items = items
         self._filtered = items.copy()
         self._query = ""
+        self._pools = [items]
         self._selected.clear()
 
         # Clear query display
@@ -18,8 +18,11 @@ from textual.widgets import TextArea
 
 __all__ = ["PatternEditor", "PatternEntry", "PatternState", "ValidationState"]
 
+# Bracket content that is a gap ([N] or [N-M]) rather than a literal
+_GAP_RE = re.compile(r"\d+(-\d+)?")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PatternEntry:
     """A literal text entry with position information from output pane."""
 
@@ -144,7 +147,7 @@ def _is_gap_content(content: str) -> bool:
     """Check if bracket content is a gap (not a literal)."""
     if content in ("*", "+"):
         return True
-    if re.fullmatch(r"\d+(-\d+)?", content):
+    if _GAP_RE.fullmatch(content):
         return True
     return False
 